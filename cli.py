@@ -5,13 +5,17 @@ from pathlib import Path
 from typing import Optional, List, Dict
 from rich.console import Console
 from rich.table import Table
-from rich.progress import Progress, TaskID
 
 from harmonizer_app import FinancialHarmonizer
+from config.providers import load_json_file
 
 app = typer.Typer(help="Financial Data Harmonizer CLI")
 console = Console()
 
+def _load_mapping(mapping_file: Path) -> Dict[str, str]:
+    """Load a provider mapping file, reusing the parsed result while it is unchanged."""
+    return load_json_file(mapping_file)
+
 @app.command("process-file")
 def process_file(
     file_path: Path = typer.Argument(..., help="Path to the file to process"),
@@ -19,6 +23,7 @@ def process_file(
     config_path: Optional[Path] = typer.Option(None, "--config", "-c", help="Path to configuration file"),
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="Path to save the output"),
     format: str = typer.Option("csv", "--format", "-f", help="Output format (csv or excel)"),
+    engine: str = typer.Option("default", "--engine", "-e", help="Export engine (default, fast-excel for Excel or arrow for CSV)"),
 ):
     """Process a single file with the specified provider configuration."""
     if not file_path.exists():
@@ -35,7 +40,7 @@ def process_file(
         console.print(f"[bold green]Success![/bold green] Processed {result['row_count']} rows.")
         
         if output:
-            export_result = harmonizer.export_results(output_path=str(output), format=format)
+            export_result = harmonizer.export_results(output_path=str(output), format=format, engine=engine)
             if export_result["success"]:
                 console.print(f"[bold green]Data exported to:[/bold green] {export_result['path']}")
                 console.print(f"[bold green]Logs exported to:[/bold green] {export_result['log_path']}")
@@ -55,6 +60,8 @@ def process_directory(
     config_path: Optional[Path] = typer.Option(None, "--config", "-c", help="Path to configuration file"),
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="Path to save the output"),
     format: str = typer.Option("csv", "--format", "-f", help="Output format (csv or excel)"),
+    engine: str = typer.Option("default", "--engine", "-e", help="Export engine (default, fast-excel for Excel or arrow for CSV)"),
+    jobs: int = typer.Option(os.cpu_count() or 1, "--jobs", "-j", help="Number of worker processes (1 to run serially)"),
 ):
     """Process all compatible files in a directory using provider mapping."""
     if not directory_path.exists() or not directory_path.is_dir():
@@ -66,8 +73,7 @@ def process_directory(
         raise typer.Exit(1)
     
     try:
-        with open(mapping_file, 'r') as f:
-            provider_mapping = json.load(f)
+        provider_mapping = _load_mapping(mapping_file)
     except json.JSONDecodeError:
         console.print(f"[bold red]Error:[/bold red] Invalid JSON in mapping file.")
         raise typer.Exit(1)
@@ -75,20 +81,28 @@ def process_directory(
     console.print(f"[bold green]Processing directory:[/bold green] {directory_path}")
     console.print(f"[bold green]Provider mappings:[/bold green] {len(provider_mapping)} patterns")
     
+    from rich.progress import Progress
+    
     harmonizer = FinancialHarmonizer(config_path=config_path)
     
+    # The harmonizer only starts a worker pool once it knows there are enough files
     with Progress() as progress:
         task = progress.add_task("[cyan]Processing files...", total=None)
-        result = harmonizer.process_directory(directory_path=directory_path, provider_mapping=provider_mapping)
-        progress.update(task, completed=100)
+        result = harmonizer.process_directory(
+            directory_path=directory_path,
+            provider_mapping=provider_mapping,
+            processes=jobs,
+            progress_callback=lambda completed, total: progress.update(task, completed=completed, total=total)
+        )
     
     if result["success"]:
         console.print(f"[bold green]Success![/bold green] Processed {result['processed']} files.")
         console.print(f"[bold yellow]Skipped:[/bold yellow] {result['skipped']} files (no provider mapping).")
         console.print(f"[bold red]Errors:[/bold red] {result['errors']} files.")
         
-        if output and harmonizer.master_data is not None and not harmonizer.master_data.empty:
-            export_result = harmonizer.export_results(output_path=str(output), format=format)
+        # has_data avoids merging the per-file frames, which the CSV export writes directly
+        if output and harmonizer.has_data:
+            export_result = harmonizer.export_results(output_path=str(output), format=format, engine=engine)
             if export_result["success"]:
                 console.print(f"[bold green]Data exported to:[/bold green] {export_result['path']}")
                 console.print(f"[bold green]Logs exported to:[/bold green] {export_result['log_path']}")
@@ -108,6 +122,8 @@ def process_sharepoint(
     config_path: Path = typer.Argument(..., help="Path to configuration file with SharePoint credentials"),
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="Path to save the output"),
     format: str = typer.Option("csv", "--format", "-f", help="Output format (csv or excel)"),
+    engine: str = typer.Option("default", "--engine", "-e", help="Export engine (default, fast-excel for Excel or arrow for CSV)"),
+    jobs: int = typer.Option(os.cpu_count() or 1, "--jobs", "-j", help="Number of worker processes (1 to run serially)"),
 ):
     """Process files from a SharePoint folder using provider mapping."""
     if not config_path.exists():
@@ -119,8 +135,7 @@ def process_sharepoint(
         raise typer.Exit(1)
     
     try:
-        with open(mapping_file, 'r') as f:
-            provider_mapping = json.load(f)
+        provider_mapping = _load_mapping(mapping_file)
     except json.JSONDecodeError:
         console.print(f"[bold red]Error:[/bold red] Invalid JSON in mapping file.")
         raise typer.Exit(1)
@@ -134,18 +149,26 @@ def process_sharepoint(
         console.print(f"[bold red]Error:[/bold red] SharePoint connector not configured in the configuration file.")
         raise typer.Exit(1)
     
+    from rich.progress import Progress
+    
+    # The harmonizer only starts a worker pool once it knows there are enough files
     with Progress() as progress:
         task = progress.add_task("[cyan]Processing SharePoint files...", total=None)
-        result = harmonizer.process_sharepoint_folder(folder_path=folder_path, provider_mapping=provider_mapping)
-        progress.update(task, completed=100)
+        result = harmonizer.process_sharepoint_folder(
+            folder_path=folder_path,
+            provider_mapping=provider_mapping,
+            processes=jobs,
+            progress_callback=lambda completed, total: progress.update(task, completed=completed, total=total)
+        )
     
     if result["success"]:
         console.print(f"[bold green]Success![/bold green] Processed {result['processed']} files.")
         console.print(f"[bold yellow]Skipped:[/bold yellow] {result['skipped']} files (no provider mapping).")
         console.print(f"[bold red]Errors:[/bold red] {result['errors']} files.")
         
-        if output and harmonizer.master_data is not None and not harmonizer.master_data.empty:
-            export_result = harmonizer.export_results(output_path=str(output), format=format)
+        # has_data avoids merging the per-file frames, which the CSV export writes directly
+        if output and harmonizer.has_data:
+            export_result = harmonizer.export_results(output_path=str(output), format=format, engine=engine)
             if export_result["success"]:
                 console.print(f"[bold green]Data exported to:[/bold green] {export_result['path']}")
                 console.print(f"[bold green]Logs exported to:[/bold green] {export_result['log_path']}")
@@ -246,10 +269,17 @@ def display_data_summary(df):
     col_table.add_column("Data Type")
     col_table.add_column("Sample Values")
     
-    # Sample a few columns to display
+    # Sample a few columns to display, only looking at the first rows
     sample_cols = df.columns[:10] if len(df.columns) > 10 else df.columns
-    for col in sample_cols:
-        sample_vals = df[col].dropna().astype(str).head(3).tolist()
+    head_df = df.iloc[:50, :len(sample_cols)]
+    dtypes = head_df.dtypes.tolist()
+    rows = []
+    for position, ((col, series), dtype) in enumerate(zip(head_df.items(), dtypes)):
+        sample_vals = series.dropna().head(3)
+        if sample_vals.empty:
+            # Sparse columns may only have values further down
+            sample_vals = df.iloc[:, position].dropna().head(3)
+        sample_vals = sample_vals.astype(str).tolist()
         if len(sample_vals) > 0:
             sample_str = ", ".join(sample_vals[:3])
             if len(sample_str) > 50:
@@ -257,7 +287,10 @@ def display_data_summary(df):
         else:
             sample_str = "(No non-null values)"
             
-        col_table.add_row(col, str(df[col].dtype), sample_str)
+        rows.append((str(col), str(dtype), sample_str))
+    
+    for row in rows:
+        col_table.add_row(*row)
     
     if len(df.columns) > 10:
         col_table.add_row("...", "...", "...")
@@ -1,9 +1,68 @@
 import os
+import copy
 import json
-import yaml
+import functools
+import hashlib
+import mmap
+import pickle
 from pathlib import Path
 from typing import Dict, List, Optional, Union, Any
 
+# orjson is optional; fall back to the stdlib parser when it is missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Directory for pickled provider caches shared between runs
+CACHE_DIR = Path.home() / '.cache' / 'dataprocessor'
+
+# JSON files at least this large are memory-mapped instead of read
+MMAP_THRESHOLD = 1024 * 1024
+
+@functools.lru_cache(maxsize=128)
+def _parse_json_file(path: str, mtime_ns: int) -> Any:
+    """Parse a JSON file; the mtime is part of the cache key so edits invalidate it."""
+    # Raw descriptor reads skip the buffered reader; orjson parses the bytes directly
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        remaining = os.fstat(fd).st_size
+        
+        # Large files are parsed straight from the page cache without a bytes copy
+        if orjson is not None and remaining >= MMAP_THRESHOLD:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        
+        chunks = []
+        while True:
+            chunk = os.read(fd, max(remaining, 1))
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        content = b''.join(chunks)
+    finally:
+        os.close(fd)
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def load_json_file(path: Union[str, Path]) -> Any:
+    """
+    Load a JSON file, reusing the parsed result while the file is unchanged.
+    
+    Args:
+        path: Path to the JSON file
+        
+    Returns:
+        The parsed JSON content (shared between callers, treat it as read-only)
+        
+    Raises:
+        json.JSONDecodeError: If the file does not contain valid JSON
+    """
+    path = str(path)
+    return _parse_json_file(path, os.stat(path).st_mtime_ns)
+
 class ProviderConfig:
     """Manages provider configurations with caching for performance."""
     
@@ -11,32 +70,107 @@ class ProviderConfig:
         """Initialize with optional config directory path."""
         self.config_dir = config_dir or os.path.join(os.path.dirname(__file__), 'providers')
         self.providers_cache = {}
+        self._dir_mtime_ns = None
+        self._missing = set()
         self._load_providers()
     
     def _load_providers(self) -> None:
         """Load all provider configurations from the config directory."""
         if not os.path.exists(self.config_dir):
             os.makedirs(self.config_dir)
-            
+        
+        self._dir_mtime_ns = os.stat(self.config_dir).st_mtime_ns
+        self._missing.clear()
+        
+        # Collect JSON and YAML configs in a single directory pass
+        json_paths = []
+        yaml_paths = []
+        file_stats = []
+        with os.scandir(self.config_dir) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                if entry.name.endswith('.json'):
+                    json_paths.append(entry.path)
+                elif entry.name.endswith('.yaml'):
+                    yaml_paths.append(entry.path)
+                else:
+                    continue
+                stat = entry.stat()
+                file_stats.append((entry.name, stat.st_mtime_ns, stat.st_size))
+        
+        # Reuse the providers parsed by a previous run if no config changed
+        signature = (self._dir_mtime_ns, tuple(sorted(file_stats)))
+        providers = self._read_disk_cache(signature)
+        if providers is None:
+            providers = self._parse_provider_files(json_paths, yaml_paths)
+            self._write_disk_cache(signature, providers)
+        
+        self.providers_cache.update(providers)
+    
+    def _parse_provider_files(self, json_paths: List[str], yaml_paths: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Parse provider config files into a dictionary keyed by upper-case provider name."""
+        providers = {}
+        
         # Load from JSON files in the config directory
-        for file_path in Path(self.config_dir).glob('*.json'):
+        for file_path in json_paths:
             try:
-                with open(file_path, 'r') as f:
-                    provider_data = json.load(f)
-                    if 'ProviderName' in provider_data:
-                        self.providers_cache[provider_data['ProviderName'].upper()] = provider_data
+                provider_data = load_json_file(file_path)
+                if 'ProviderName' in provider_data:
+                    # Provider settings are handed out for editing, so keep them apart from the parse cache
+                    providers[provider_data['ProviderName'].upper()] = copy.deepcopy(provider_data)
             except Exception as e:
                 print(f"Error loading provider config {file_path}: {e}")
-                
-        # Also load from YAML files
-        for file_path in Path(self.config_dir).glob('*.yaml'):
+        
+        if not yaml_paths:
+            return providers
+        
+        # Also load from YAML files, importing PyYAML only when needed
+        import yaml
+        for file_path in yaml_paths:
             try:
                 with open(file_path, 'r') as f:
                     provider_data = yaml.safe_load(f)
                     if 'ProviderName' in provider_data:
-                        self.providers_cache[provider_data['ProviderName'].upper()] = provider_data
+                        providers[provider_data['ProviderName'].upper()] = provider_data
             except Exception as e:
                 print(f"Error loading provider config {file_path}: {e}")
+        
+        return providers
+    
+    def _disk_cache_path(self) -> Path:
+        """Get the pickle cache file for this config directory."""
+        digest = hashlib.sha1(os.path.abspath(self.config_dir).encode('utf-8')).hexdigest()
+        return CACHE_DIR / f"providers_{digest}.pkl"
+    
+    def _read_disk_cache(self, signature: Any) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Load cached providers if they were stored for the same directory signature."""
+        try:
+            with open(self._disk_cache_path(), 'rb') as f:
+                cached_signature, providers = pickle.load(f)
+        except Exception:
+            return None
+        return providers if cached_signature == signature else None
+    
+    def _write_disk_cache(self, signature: Any, providers: Dict[str, Dict[str, Any]]) -> None:
+        """Store parsed providers for the next run; failures only cost a reparse later."""
+        cache_path = self._disk_cache_path()
+        # Write to a per-process temp file first so concurrent runs never see a partial pickle
+        temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, 'wb') as f:
+                pickle.dump((signature, providers), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, cache_path)
+        except (OSError, pickle.PickleError):
+            pass
+    
+    def _config_dir_changed(self) -> bool:
+        """Check whether files were added to or removed from the config directory since the last load."""
+        try:
+            return os.stat(self.config_dir).st_mtime_ns != self._dir_mtime_ns
+        except OSError:
+            return True
     
     def get_provider_settings(self, provider_name: str) -> Dict[str, Any]:
         """
@@ -61,11 +195,16 @@ class ProviderConfig:
             return self.providers_cache[provider_name]
         
         # If not in cache, maybe config was added since initialization
-        self._load_providers()
+        if self._config_dir_changed():
+            self._load_providers()
+        elif provider_name in self._missing:
+            raise ValueError(f"No matching provider found for: {provider_name}")
         
         if provider_name in self.providers_cache:
             return self.providers_cache[provider_name]
         
+        # Remember the miss until the directory changes
+        self._missing.add(provider_name)
         raise ValueError(f"No matching provider found for: {provider_name}")
     
     def save_provider(self, provider_config: Dict[str, Any]) -> None:
@@ -76,8 +215,24 @@ class ProviderConfig:
         provider_name = provider_config['ProviderName']
         file_path = os.path.join(self.config_dir, f"{provider_name}.json")
         
-        with open(file_path, 'w') as f:
-            json.dump(provider_config, f, indent=2)
-            
+        if orjson is not None:
+            content = orjson.dumps(provider_config, option=orjson.OPT_INDENT_2)
+        else:
+            content = json.dumps(provider_config, indent=2).encode('utf-8')
+        
+        # Write to a temp file and swap it in so readers never see a partial config
+        dir_was_current = not self._config_dir_changed()
+        temp_path = f"{file_path}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, file_path)
+        
         # Update cache
         self.providers_cache[provider_name.upper()] = provider_config
+        self._missing.discard(provider_name.upper())
+        
+        # Our own write should not trigger a rescan, but changes made by others since the last load should
+        if dir_was_current:
+            self._dir_mtime_ns = os.stat(self.config_dir).st_mtime_ns
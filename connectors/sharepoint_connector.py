@@ -1,23 +1,89 @@
 import os
-from typing import Dict, List, Optional, Any, Union
+import asyncio
+import uuid
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Any, Union, Tuple
 from pathlib import Path
 import pandas as pd
 import json
 import datetime
 import warnings
 
-# Handle missing shareplum gracefully
-SHAREPLUM_AVAILABLE = False
+# Handle missing shareplum gracefully; it is only imported once we connect
+SHAREPLUM_AVAILABLE = importlib.util.find_spec('shareplum') is not None
+if not SHAREPLUM_AVAILABLE:
+    warnings.warn("SharePoint integration unavailable: shareplum package not installed")
+
+# aiohttp is optional; without it files are downloaded one at a time
+AIOHTTP_AVAILABLE = False
 try:
-    from shareplum import Site, Office365
-    from shareplum.site import Version
-    SHAREPLUM_AVAILABLE = True
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
 except ImportError:
-    warnings.warn("SharePoint integration unavailable: shareplum package not installed")
+    pass
+
+# Bound once at import so log entries skip the module/class attribute lookups
+_utcnow = datetime.datetime.utcnow
+
+def _file_extension(name: str) -> str:
+    """Get the lower-cased extension of a file name (same rules as os.path.splitext)."""
+    head, dot, tail = name.rpartition('.')
+    # Leading dots (e.g. '.csv') do not start an extension
+    if not dot or not head.strip('.'):
+        return ''
+    return '.' + tail.lower()
+
+def _event_loop_running() -> bool:
+    """Check whether this thread is already running an asyncio event loop (e.g. Jupyter)."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+def _parse_batch_response(content: bytes, boundary: bytes) -> List[Tuple[int, bytes]]:
+    """
+    Split a multipart/mixed $batch response into its sub-responses.
+    
+    Args:
+        content: Raw response body
+        boundary: Multipart boundary from the response Content-Type header
+        
+    Returns:
+        List of (HTTP status code, body) tuples in request order
+    """
+    responses = []
+    for part in content.split(b'--' + boundary)[1:]:
+        if part.startswith(b'--'):
+            break
+        
+        # Each part wraps an HTTP message: part headers, status line + headers, body
+        _, _, http_message = part.partition(b'\r\n\r\n')
+        head, _, body = http_message.partition(b'\r\n\r\n')
+        status_line = head.split(b'\r\n', 1)[0].split()
+        try:
+            status = int(status_line[1])
+        except (IndexError, ValueError):
+            status = 0
+        if body.endswith(b'\r\n'):
+            body = body[:-2]
+        responses.append((status, body))
+    
+    return responses
 
 class SharePointConnector:
     """Connector for retrieving files and metadata from SharePoint."""
     
+    # Maximum number of file downloads in flight at once
+    MAX_CONCURRENT_DOWNLOADS = 32
+    
+    # Default thread count for per-file downloads without aiohttp (override with SP_MAX_WORKERS)
+    MAX_DOWNLOAD_THREADS = 16
+    
+    # Maximum number of sub-requests SharePoint accepts in one $batch request
+    BATCH_SIZE = 100
+    
     def __init__(self, site_url: str, username: Optional[str] = None, password: Optional[str] = None, config_path: Optional[str] = None):
         """
         Initialize SharePoint connector.
@@ -34,6 +100,7 @@ class SharePointConnector:
         self.config_path = config_path
         self.connection = None
         self.site = None
+        self.authcookie = None
         self.log_entries = []
         
         if not SHAREPLUM_AVAILABLE:
@@ -48,7 +115,7 @@ class SharePointConnector:
         """Create a standardized log entry."""
         log_entry = {
             "Step": step,
-            "Timestamp": datetime.datetime.utcnow().isoformat(),
+            "Timestamp": _utcnow().isoformat(),
             "Source": source,
             "ActionDetail": detail,
             "Message": message
@@ -90,10 +157,13 @@ class SharePointConnector:
                 )
                 return False
             
+            from shareplum import Site, Office365
+            from shareplum.site import Version
+            
             # Connect using Office365 auth
             auth_site = self.site_url
-            authcookie = Office365(auth_site, username=self.username, password=self.password).GetCookie()
-            self.site = Site(self.site_url, version=Version.v365, authcookie=authcookie)
+            self.authcookie = Office365(auth_site, username=self.username, password=self.password).GetCookie()
+            self.site = Site(self.site_url, version=Version.v365, authcookie=self.authcookie)
             
             self.create_log_entry(
                 "Connect", 
@@ -146,28 +216,44 @@ class SharePointConnector:
             # Get files
             files = folder.files
             
-            # Filter by extension if specified
+            # Tag each file with its extension and folder, filtering in the same pass
+            ext_set = None
             if file_extensions:
-                file_extensions = [ext.lower() if ext.startswith('.') else f'.{ext.lower()}' for ext in file_extensions]
-                filtered_files = []
-                for file_info in files:
-                    name = file_info.get('Name', '')
-                    _, ext = os.path.splitext(name)
-                    if ext.lower() in file_extensions:
-                        filtered_files.append(file_info)
-                files = filtered_files
-            
-            # Add file content
+                ext_set = frozenset('.' + ext.lower().lstrip('.') for ext in file_extensions)
+            filtered_files = []
             for file_info in files:
-                name = file_info.get('Name', '')
-                try:
-                    file_content = folder.get_file(name)
-                    file_info['Content'] = file_content
-                    file_info['Extension'] = os.path.splitext(name)[1].lower()
+                ext = _file_extension(file_info.get('Name', ''))
+                if ext_set is None or ext in ext_set:
+                    file_info['Extension'] = ext
                     file_info['FolderPath'] = folder_path
-                except Exception as e:
-                    file_info['Content'] = None
-                    file_info['Error'] = str(e)
+                    filtered_files.append(file_info)
+            files = filtered_files
+            
+            # Fetch as many files as possible through $batch requests, then
+            # download anything the batches did not return individually
+            pending = files
+            if self.authcookie is not None:
+                self._fetch_batched(files)
+                pending = [file_info for file_info in files if file_info.get('Content') is None]
+            
+            # asyncio.run cannot start inside a running loop, so async hosts use the threads
+            if AIOHTTP_AVAILABLE and self.authcookie is not None and not _event_loop_running():
+                asyncio.run(self._fetch_all(pending))
+            else:
+                # get_file releases the GIL while waiting on the network, so threads overlap downloads
+                max_workers = int(os.environ.get('SP_MAX_WORKERS', self.MAX_DOWNLOAD_THREADS))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {
+                        executor.submit(folder.get_file, file_info.get('Name', '')): file_info
+                        for file_info in pending
+                    }
+                    for future in as_completed(futures):
+                        file_info = futures[future]
+                        try:
+                            file_info['Content'] = future.result()
+                        except Exception as e:
+                            file_info['Content'] = None
+                            file_info['Error'] = str(e)
             
             self.create_log_entry(
                 "Get Files", 
@@ -187,6 +273,119 @@ class SharePointConnector:
             )
             return {"Files": [], "Log": self.log_entries}
     
+    def _file_value_url(self, file_info: Dict[str, Any]) -> str:
+        """Build the REST URL returning the raw content of a file."""
+        # OData string literals escape single quotes by doubling them
+        server_relative_url = file_info.get('ServerRelativeUrl', '').replace("'", "''")
+        return f"{self.site_url}/_api/web/GetFileByServerRelativeUrl('{server_relative_url}')/$value"
+    
+    def _fetch_batched(self, files: List[Dict[str, Any]]) -> None:
+        """
+        Download file contents with OData $batch requests of up to BATCH_SIZE files.
+        
+        Populates 'Content' on each file info dictionary whose sub-request
+        succeeded; files that failed are left for the per-file download.
+        
+        Args:
+            files: List of file info dictionaries from the folder listing
+        """
+        import requests
+        
+        try:
+            session = requests.Session()
+            session.cookies = self.authcookie
+            
+            # POST requests need a form digest
+            context = session.post(
+                f"{self.site_url}/_api/contextinfo",
+                headers={'Accept': 'application/json;odata=verbose'}
+            )
+            context.raise_for_status()
+            digest = context.json()['d']['GetContextWebInformation']['FormDigestValue']
+        except Exception as e:
+            self.create_log_entry("Batch Download", "SharePointConnector", "Failed to get form digest", str(e))
+            return
+        
+        for start in range(0, len(files), self.BATCH_SIZE):
+            chunk = files[start:start + self.BATCH_SIZE]
+            boundary = f"batch_{uuid.uuid4()}"
+            
+            parts = []
+            for file_info in chunk:
+                parts.append(
+                    f"--{boundary}\r\n"
+                    "Content-Type: application/http\r\n"
+                    "Content-Transfer-Encoding: binary\r\n"
+                    "\r\n"
+                    f"GET {self._file_value_url(file_info)} HTTP/1.1\r\n"
+                    "Accept: application/octet-stream\r\n"
+                    "\r\n"
+                )
+            parts.append(f"--{boundary}--\r\n")
+            
+            try:
+                response = session.post(
+                    f"{self.site_url}/_api/$batch",
+                    data="".join(parts).encode('utf-8'),
+                    headers={
+                        'Content-Type': f'multipart/mixed; boundary={boundary}',
+                        'X-RequestDigest': digest
+                    }
+                )
+                response.raise_for_status()
+                
+                content_type = response.headers.get('Content-Type', '')
+                response_boundary = content_type.split('boundary=', 1)[1].strip('"')
+                sub_responses = _parse_batch_response(response.content, response_boundary.encode('utf-8'))
+            except Exception as e:
+                self.create_log_entry(
+                    "Batch Download", 
+                    "SharePointConnector", 
+                    f"Batch of {len(chunk)} files failed", 
+                    str(e)
+                )
+                continue
+            
+            # Sub-responses are matched to files by position, which is only safe if none are missing
+            if len(sub_responses) != len(chunk):
+                self.create_log_entry(
+                    "Batch Download", 
+                    "SharePointConnector", 
+                    f"Batch of {len(chunk)} files failed", 
+                    f"Expected {len(chunk)} sub-responses, got {len(sub_responses)}"
+                )
+                continue
+            
+            for file_info, (status, body) in zip(chunk, sub_responses):
+                if 200 <= status < 300:
+                    file_info['Content'] = body
+    
+    async def _fetch_all(self, files: List[Dict[str, Any]]) -> None:
+        """
+        Download the content of all files concurrently via the SharePoint REST API.
+        
+        Populates 'Content' (or 'Error') on each file info dictionary in place.
+        
+        Args:
+            files: List of file info dictionaries from the folder listing
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_DOWNLOADS)
+        cookies = {cookie.name: cookie.value for cookie in self.authcookie}
+        
+        async def fetch(session: "aiohttp.ClientSession", file_info: Dict[str, Any]) -> None:
+            url = self._file_value_url(file_info)
+            async with semaphore:
+                try:
+                    async with session.get(url) as response:
+                        response.raise_for_status()
+                        file_info['Content'] = await response.read()
+                except Exception as e:
+                    file_info['Content'] = None
+                    file_info['Error'] = str(e)
+        
+        async with aiohttp.ClientSession(cookies=cookies) as session:
+            await asyncio.gather(*(fetch(session, file_info) for file_info in files))
+    
     def get_list_items(self, list_name: str, query: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Get items from a SharePoint list.
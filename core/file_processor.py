@@ -1,146 +1,432 @@
 import pandas as pd
 import numpy as np
 import os
+import datetime
 import csv
-from typing import Dict, List, Optional, Tuple, Any, Union
-from pathlib import Path
+import importlib.util
+import io
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Deque, Dict, List, Optional, Tuple, Any, Union
+from pathlib import Path, PurePath
 import re
+from functools import lru_cache
+
+def _detect_excel_engine() -> Optional[str]:
+    """Pick the fastest available pandas Excel engine (None lets pandas use openpyxl/xlrd)."""
+    # The Rust-based calamine engine reads both xlsx and legacy xls and is
+    # supported by pandas from 2.2 onwards
+    pandas_version = tuple(int(part) for part in re.findall(r'\d+', pd.__version__)[:2])
+    if pandas_version >= (2, 2) and importlib.util.find_spec('python_calamine') is not None:
+        return 'calamine'
+    return None
+
+EXCEL_ENGINE = _detect_excel_engine()
+
+# Number of leading rows searched for the header row
+HEADER_SCAN_ROWS = 200
+
+_utcnow = datetime.datetime.utcnow
+
+# polars is optional; when installed it handles CSV ingest and header detection
+POLARS_AVAILABLE = False
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    pass
+
+# pyarrow is optional; it provides a multi-threaded CSV reader, string kernels and Parquet/Feather support
+PYARROW_AVAILABLE = False
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    import pyarrow.feather as pa_feather
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pass
+
+# pyahocorasick is optional; it matches long alternate name lists in one pass per cell
+AHOCORASICK_AVAILABLE = False
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    pass
+
+# Below this many alternate names the regex alternation is just as fast
+AHOCORASICK_MIN_NAMES = 20
+
+# Synonyms of these types are computed values, not header names
+_SPECIAL_SYNONYM = re.compile(r"calculated|regex|concat|hardcoded", re.IGNORECASE)
+
+# Characters that must be escaped in the Rust regex syntax used by polars
+_RUST_REGEX_META = re.compile(r'([\\.+*?()|\[\]{}^$#&\-~])')
+
+def _escape_rust_regex(text: str) -> str:
+    """Escape a literal for use in a polars (Rust) regular expression."""
+    return _RUST_REGEX_META.sub(r'\\\1', text)
+
+def _is_arrow_string(dtype) -> bool:
+    """Check whether a column dtype is a pyarrow-backed pandas string."""
+    return isinstance(dtype, pd.StringDtype) and str(dtype.storage).startswith("pyarrow")
+
+@lru_cache(maxsize=32)
+def _build_automaton(alt_names: Tuple[str, ...]):
+    """Build a lower-cased Aho-Corasick automaton, shared across sheets and files."""
+    automaton = ahocorasick.Automaton()
+    for index, name in enumerate(alt_names):
+        automaton.add_word(name.lower(), index)
+    automaton.make_automaton()
+    return automaton
+
+class _AltNameMatcher:
+    """
+    Case-insensitive matcher for many alternate names backed by Aho-Corasick.
+    
+    Mirrors the parts of re.Pattern used by header detection: search() for
+    cell matching and pattern for the Arrow regex kernel.
+    """
+    
+    def __init__(self, alt_names: List[str], pattern: str):
+        self._automaton = _build_automaton(tuple(sorted(set(alt_names))))
+        self.pattern = pattern
+    
+    def search(self, text: str):
+        """Return the first (end index, name index) hit, or None."""
+        return next(self._automaton.iter(text.lower()), None)
 
 class FileProcessor:
     """Processes Excel and CSV files with intelligent header detection."""
     
-    def __init__(self):
-        self.log_entries = []
+    # Handler method for each supported file extension
+    _HANDLERS = {
+        '.xlsx': '_process_excel',
+        '.xls': '_process_excel',
+        '.csv': '_process_csv',
+        '.parquet': '_process_columnar',
+        '.feather': '_process_columnar',
+    }
+    
+    def __init__(self, max_log_entries: Optional[int] = None,
+                 log_sink: Optional[Callable[[Dict[str, Any]], None]] = None):
+        """
+        Initialize the file processor.
+        
+        Args:
+            max_log_entries: Keep only this many recent entries in log_entries (None keeps all)
+            log_sink: Optional callback receiving every log entry as it is created
+        """
+        self.log_entries: Deque[Dict[str, Any]] = deque(maxlen=max_log_entries)
+        self.log_sink = log_sink
+        # Entries of the process_file call in progress, returned as its "Log"
+        self._call_log: List[Dict[str, Any]] = []
+        # In-memory content of the file being processed, if it was passed to process_file
+        self._content: Optional[bytes] = None
+        # Filtered alternate names and compiled matchers, reused across files with the same synonyms
+        self._alt_name_cache: Dict[Tuple[str, ...], List[str]] = {}
+        self._pattern_cache: Dict[Tuple[str, ...], Optional[re.Pattern]] = {}
+        # Synonyms list seen last and its filtered names; provider settings hand out the same list per file
+        self._last_synonyms: Optional[List[Dict[str, Any]]] = None
+        self._last_alt_names: List[str] = []
     
     def create_log_entry(self, step: str, source: str, detail: str, message: str) -> Dict[str, Any]:
-        """Create a standardized log entry."""
-        import datetime
+        """Create a standardized log entry and record it."""
         log_entry = {
             "Step": step,
-            "Timestamp": datetime.datetime.utcnow().isoformat(),
+            "Timestamp": _utcnow().isoformat(),
             "Source": source,
             "ActionDetail": detail,
             "Message": message
         }
         self.log_entries.append(log_entry)
+        self._call_log.append(log_entry)
+        if self.log_sink is not None:
+            self.log_sink(log_entry)
         return log_entry
     
     def safe_call(self, fn, step_name: str, source: str) -> Dict[str, Any]:
         """Safely execute a function and log the result."""
         try:
             result = fn()
-            self.create_log_entry(step_name, source, "", "Success")
-            return {"Result": result, "Log": self.log_entries[-1]}
         except Exception as e:
-            self.create_log_entry(step_name, source, "", str(e))
-            return {"Result": None, "Log": self.log_entries[-1]}
+            return {"Result": None, "Log": self.create_log_entry(step_name, source, "", str(e))}
+        return {"Result": result, "Log": self.create_log_entry(step_name, source, "", "Success")}
     
-    def process_file(self, file_path: Union[str, Path], synonyms: List[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def process_file(self, file_path: Union[str, Path], synonyms: List[Dict[str, Any]] = None,
+                     content: Optional[bytes] = None) -> Dict[str, Any]:
         """
-        Process a file (Excel or CSV) and extract structured data.
+        Process a file (Excel, CSV, Parquet or Feather) and extract structured data.
         
         Args:
-            file_path: Path to the file
+            file_path: Path to the file, or just its name when content is given
             synonyms: List of synonym configurations for header matching
+            content: Optional file content already in memory (e.g. downloaded from
+                SharePoint); it is parsed directly instead of reading file_path
             
         Returns:
             Dictionary with:
                 - PreHeaderText: Text extracted above headers
                 - Data: Pandas DataFrame with the processed data
-                - Log: Processing logs
+                - Log: Log entries from processing this file
         """
         if synonyms is None:
             synonyms = []
+        
+        # Start a fresh log for this call so results don't carry earlier files' entries
+        self._call_log = []
+        self._content = content
             
         # Extract file extension
-        file_extension = os.path.splitext(str(file_path))[1].lower()
+        file_extension = PurePath(file_path).suffix.lower()
         
-        # Get all alternate names for header matching
-        alt_names_raw = []
-        for syn in synonyms:
-            if 'AlternateNames' in syn:
-                alt_names_raw.extend(syn['AlternateNames'])
-                
-        # Filter out special synonym types
-        filtered_alt_names = [
-            x for x in alt_names_raw
-            if not any(special in x.lower() for special in ["calculated", "regex", "concat", "hardcoded"]) 
-            and x.strip()
-        ]
+        # Get the alternate names usable for header matching
+        filtered_alt_names = self._header_alt_names(synonyms)
         
         # Process based on file type
-        if file_extension in ['.xlsx', '.xls']:
-            result = self._process_excel(file_path, filtered_alt_names)
-        elif file_extension == '.csv':
-            result = self._process_csv(file_path, filtered_alt_names)
-        else:
+        handler_name = self._HANDLERS.get(file_extension)
+        if handler_name is None:
             self.create_log_entry("Process File", "FileProcessor", file_extension, "Unsupported file type")
             return {
                 "PreHeaderText": "",
                 "Data": pd.DataFrame(),
-                "Log": self.log_entries
+                "Log": self._call_log
             }
             
-        return result
+        try:
+            return getattr(self, handler_name)(file_path, filtered_alt_names)
+        finally:
+            self._content = None
+        
+    def process_files(self, file_paths: List[Union[str, Path]], synonyms: List[Dict[str, Any]] = None,
+                      max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Process several files concurrently on a thread pool.
+        
+        The Excel (calamine) and CSV (pyarrow/polars) parsers release the GIL,
+        so threads overlap the parse step. Each file gets its own FileProcessor
+        sharing this instance's compiled matchers; their logs are added to this
+        instance in input order once all files are done.
+        
+        Args:
+            file_paths: Paths of the files to process
+            synonyms: List of synonym configurations for header matching
+            max_workers: Number of threads (defaults to the CPU count)
+            
+        Returns:
+            List of process_file results, in the order of file_paths
+        """
+        if synonyms is None:
+            synonyms = []
+        
+        def process_one(file_path: Union[str, Path]) -> Dict[str, Any]:
+            worker = FileProcessor(max_log_entries=0)
+            worker._alt_name_cache = self._alt_name_cache
+            worker._pattern_cache = self._pattern_cache
+            return worker.process_file(file_path, synonyms)
+        
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            results = list(executor.map(process_one, file_paths))
+        
+        for result in results:
+            for log_entry in result["Log"]:
+                self.log_entries.append(log_entry)
+                if self.log_sink is not None:
+                    self.log_sink(log_entry)
+        return results
+    
+    def _header_alt_names(self, synonyms: List[Dict[str, Any]]) -> List[str]:
+        """
+        Get the alternate names usable for header matching from a synonym list.
+        
+        Args:
+            synonyms: List of synonym configurations
+            
+        Returns:
+            Alternate names without special synonym types or blanks
+        """
+        # Files from the same provider pass the same list object, so skip the walk entirely
+        if synonyms is self._last_synonyms:
+            return self._last_alt_names
+        
+        # Get all alternate names for header matching
+        alt_names_raw = tuple(name for syn in synonyms for name in syn.get('AlternateNames', ()))
+        
+        # Filter out special synonym types
+        filtered_alt_names = self._alt_name_cache.get(alt_names_raw)
+        if filtered_alt_names is None:
+            filtered_alt_names = [x for x in alt_names_raw if not _SPECIAL_SYNONYM.search(x) and x.strip()]
+            self._alt_name_cache[alt_names_raw] = filtered_alt_names
+        
+        self._last_synonyms = synonyms
+        self._last_alt_names = filtered_alt_names
+        return filtered_alt_names
+    
+    def _source(self, file_path: Union[str, Path]) -> Union[str, Path, io.BytesIO]:
+        """Return what pandas and polars readers should open: a buffer over in-memory content, or the path."""
+        return io.BytesIO(self._content) if self._content is not None else file_path
+    
+    def _compile_alt_names(self, alt_names: List[str]) -> Optional[re.Pattern]:
+        """
+        Compile alternate header names into one case-insensitive matcher (None if there are none).
+        
+        Long lists use an Aho-Corasick automaton when pyahocorasick is installed,
+        otherwise a regex alternation.
+        """
+        if not alt_names:
+            return None
+        key = tuple(alt_names)
+        if key not in self._pattern_cache:
+            pattern = "|".join(re.escape(alt) for alt in alt_names)
+            if AHOCORASICK_AVAILABLE and len(alt_names) >= AHOCORASICK_MIN_NAMES:
+                self._pattern_cache[key] = _AltNameMatcher(alt_names, pattern)
+            else:
+                self._pattern_cache[key] = re.compile(pattern, re.IGNORECASE)
+        return self._pattern_cache[key]
+    
+    def _find_header_row(self, frame: pd.DataFrame, pattern: re.Pattern) -> Optional[int]:
+        """
+        Find the first row with at least 3 text cells matching any alternate name.
+        
+        Only the first HEADER_SCAN_ROWS rows are scanned, as headers sit near the top.
+        
+        Args:
+            frame: Raw data read without headers
+            pattern: Compiled alternation from _compile_alt_names
+            
+        Returns:
+            Row position of the header, or None if no row matches
+        """
+        frame = frame.iloc[:HEADER_SCAN_ROWS]
+        if frame.empty:
+            return None
+        
+        # Arrow-backed string columns are matched by Arrow's regex kernel without an object copy
+        if PYARROW_AVAILABLE and all(_is_arrow_string(dtype) for dtype in frame.dtypes):
+            counts = np.zeros(len(frame), dtype=np.int64)
+            for col in frame.columns:
+                matched = pc.match_substring_regex(pa.array(frame[col]), pattern.pattern, ignore_case=True)
+                counts += matched.fill_null(False).to_numpy(zero_copy_only=False)
+            header_rows = np.flatnonzero(counts >= 3)
+            return int(header_rows[0]) if header_rows.size else None
+        
+        values = frame.to_numpy(dtype=object)
+        
+        # One regex search per text cell instead of one substring scan per alternate name
+        search = pattern.search
+        hits = np.fromiter(
+            (isinstance(val, str) and search(val) is not None for val in values.ravel()),
+            dtype=bool,
+            count=values.size
+        )
+        header_rows = np.flatnonzero(hits.reshape(values.shape).sum(axis=1) >= 3)
+        return int(header_rows[0]) if header_rows.size else None
+    
+    def _make_unique_headers(self, headers) -> List[str]:
+        """
+        Strip header names and suffix duplicates with _1, _2, ... to make them unique.
+        
+        The next free suffix is remembered per name, so repeated duplicates do
+        not rescan suffixes that are already taken.
+        """
+        unique_headers = []
+        seen = set()
+        next_suffix = {}
+        for h in headers:
+            h_str = str(h).strip()
+            if h_str in seen:
+                count = next_suffix.get(h_str, 1)
+                while f"{h_str}_{count}" in seen:
+                    count += 1
+                next_suffix[h_str] = count + 1
+                h_str = f"{h_str}_{count}"
+            seen.add(h_str)
+            unique_headers.append(h_str)
+        return unique_headers
+    
+    def _join_pre_header_cells(self, cells: np.ndarray) -> str:
+        """Join the non-blank cells above the header row, in row order, into one string."""
+        cells = cells.ravel()
+        cells = cells[pd.notna(cells)].astype(str)
+        if cells.size == 0:
+            return ""
+        return " ".join(cells[np.char.str_len(np.char.strip(cells)) > 0].tolist())
+    
+    def _probe_excel_sheets(self, file_path: Union[str, Path], pattern: re.Pattern) -> Optional[str]:
+        """
+        Find the first sheet with a header row using calamine, without parsing whole sheets.
+        
+        Args:
+            file_path: Path to the Excel file
+            pattern: Compiled alternation from _compile_alt_names
+            
+        Returns:
+            Name of the matching sheet, or None if no sheet has a header row
+        """
+        from python_calamine import CalamineWorkbook
         
+        if self._content is not None:
+            workbook = CalamineWorkbook.from_filelike(io.BytesIO(self._content))
+        else:
+            workbook = CalamineWorkbook.from_path(str(file_path))
+        search = pattern.search
+        for sheet_name in workbook.sheet_names:
+            rows = workbook.get_sheet_by_name(sheet_name).to_python(skip_empty_area=False, nrows=HEADER_SCAN_ROWS)
+            for row in rows:
+                if sum(1 for val in row if isinstance(val, str) and search(val) is not None) >= 3:
+                    return sheet_name
+        return None
+    
     def _process_excel(self, file_path: Union[str, Path], alt_names: List[str]) -> Dict[str, Any]:
         """Process Excel files."""
         try:
-            # Try to read all sheets
-            excel_data = pd.read_excel(file_path, sheet_name=None, header=None)
-            
-            # Find sheets with data
-            valid_sheets = {name: sheet for name, sheet in excel_data.items() if not sheet.empty}
+            pattern = self._compile_alt_names(alt_names)
             
-            if not valid_sheets:
-                self.create_log_entry("Process Excel", "FileProcessor", str(file_path), "No valid sheets found")
-                return {"PreHeaderText": "", "Data": pd.DataFrame(), "Log": self.log_entries}
-            
-            # Try to find a sheet with matching headers
+            # Try to find a sheet with matching headers, locating the header row in the same pass
             chosen_sheet = None
             chosen_sheet_name = None
+            header_index = 0
             
-            if alt_names:
-                for sheet_name, sheet in valid_sheets.items():
-                    # Convert all cells to string for easier matching
-                    str_sheet = sheet.astype(str)
-                    
-                    # Check if this sheet contains our expected headers
-                    for alt_name in alt_names:
-                        mask = str_sheet.apply(
-                            lambda x: x.str.contains(alt_name, case=False, na=False)
-                        ).any(axis=1)
-                        
-                        if mask.sum() >= 3:  # If we find at least 3 matches
+            # With calamine, probe the top rows of each sheet and only parse the matching one
+            if pattern is not None and EXCEL_ENGINE == 'calamine':
+                chosen_sheet_name = self._probe_excel_sheets(file_path, pattern)
+                if chosen_sheet_name is not None:
+                    chosen_sheet = pd.read_excel(self._source(file_path), sheet_name=chosen_sheet_name, header=None, engine=EXCEL_ENGINE)
+                    header_index = self._find_header_row(chosen_sheet, pattern) or 0
+            
+            if chosen_sheet is None:
+                # Try to read all sheets
+                excel_data = pd.read_excel(self._source(file_path), sheet_name=None, header=None, engine=EXCEL_ENGINE)
+                
+                # Find sheets with data
+                valid_sheets = {name: sheet for name, sheet in excel_data.items() if not sheet.empty}
+                
+                if not valid_sheets:
+                    self.create_log_entry("Process Excel", "FileProcessor", str(file_path), "No valid sheets found")
+                    return {"PreHeaderText": "", "Data": pd.DataFrame(), "Log": self._call_log}
+                
+                # Sheets were already probed when using calamine
+                if pattern is not None and EXCEL_ENGINE != 'calamine':
+                    for sheet_name, sheet in valid_sheets.items():
+                        sheet_header_index = self._find_header_row(sheet, pattern)
+                        if sheet_header_index is not None:
                             chosen_sheet = sheet
                             chosen_sheet_name = sheet_name
+                            header_index = sheet_header_index
                             break
-                    
-                    if chosen_sheet is not None:
-                        break
-            
-            # If no sheet with headers found, use the first valid sheet
-            if chosen_sheet is None:
-                chosen_sheet_name = next(iter(valid_sheets))
-                chosen_sheet = valid_sheets[chosen_sheet_name]
                 
-            # Find header row based on alternate names
-            header_index = 0
-            if alt_names:
-                for idx, row in chosen_sheet.iterrows():
-                    matches = sum(1 for val in row if isinstance(val, str) and any(
-                        alt.lower() in val.lower() for alt in alt_names
-                    ))
-                    if matches >= 3:
-                        header_index = idx
-                        break
-                        
+                # If no sheet with headers found, use the first valid sheet
+                if chosen_sheet is None:
+                    chosen_sheet_name = next(iter(valid_sheets))
+                    chosen_sheet = valid_sheets[chosen_sheet_name]
+                
             # Extract text above headers
             pre_header_text = ""
             if header_index > 0:
                 rows_above_header = chosen_sheet.iloc[:header_index]
-                pre_header_cells = rows_above_header.values.flatten()
-                pre_header_text = " ".join(str(x) for x in pre_header_cells if pd.notna(x) and str(x).strip())
+                pre_header_text = self._join_pre_header_cells(rows_above_header.to_numpy(dtype=object))
                 
             # Extract data with proper headers
             data = chosen_sheet.iloc[header_index:].reset_index(drop=True)
@@ -148,79 +434,162 @@ class FileProcessor:
             data = data.iloc[1:].reset_index(drop=True)
             
             # Make header names unique
-            unique_headers = []
-            seen = set()
-            for h in headers:
-                h_str = str(h).strip()
-                if h_str in seen:
-                    count = 1
-                    while f"{h_str}_{count}" in seen:
-                        count += 1
-                    h_str = f"{h_str}_{count}"
-                seen.add(h_str)
-                unique_headers.append(h_str)
-                
-            data.columns = unique_headers
+            data.columns = self._make_unique_headers(headers)
             
             # Drop empty columns
             data = data.dropna(axis=1, how='all')
             
             self.create_log_entry("Process Excel", "FileProcessor", str(file_path), f"Successfully processed sheet '{chosen_sheet_name}'")
-            return {"PreHeaderText": pre_header_text, "Data": data, "Log": self.log_entries}
+            return {"PreHeaderText": pre_header_text, "Data": data, "Log": self._call_log}
             
         except Exception as e:
             self.create_log_entry("Process Excel", "FileProcessor", str(file_path), f"Error: {str(e)}")
-            return {"PreHeaderText": "", "Data": pd.DataFrame(), "Log": self.log_entries}
+            return {"PreHeaderText": "", "Data": pd.DataFrame(), "Log": self._call_log}
     
     def _process_csv(self, file_path: Union[str, Path], alt_names: List[str]) -> Dict[str, Any]:
         """Process CSV files."""
         try:
-            # First read without headers to analyze
-            data = pd.read_csv(file_path, header=None)
-            
-            # Find header row based on alternate names
-            header_index = 0
-            if alt_names:
-                for idx, row in data.iterrows():
-                    matches = sum(1 for val in row if isinstance(val, str) and any(
-                        alt.lower() in val.lower() for alt in alt_names
-                    ))
-                    if matches >= 3:
-                        header_index = idx
-                        break
-            
-            # Extract text above headers
-            pre_header_text = ""
-            if header_index > 0:
-                rows_above_header = data.iloc[:header_index]
-                pre_header_cells = rows_above_header.values.flatten()
-                pre_header_text = " ".join(str(x) for x in pre_header_cells if pd.notna(x) and str(x).strip())
-                
-            # Re-read with proper header
-            data = pd.read_csv(file_path, header=header_index)
+            if POLARS_AVAILABLE:
+                pre_header_text, data = self._read_csv_polars(file_path, alt_names)
+            else:
+                pre_header_text, data = self._read_csv_pandas(file_path, alt_names)
             
             # Make header names unique
-            columns = data.columns.tolist()
-            unique_columns = []
-            seen = set()
-            for c in columns:
-                c_str = str(c).strip()
-                if c_str in seen:
-                    count = 1
-                    while f"{c_str}_{count}" in seen:
-                        count += 1
-                    c_str = f"{c_str}_{count}"
-                seen.add(c_str)
-                unique_columns.append(c_str)
-                
-            data.columns = unique_columns
+            data.columns = self._make_unique_headers(data.columns)
             
             # Drop empty columns
             data = data.dropna(axis=1, how='all')
             
             self.create_log_entry("Process CSV", "FileProcessor", str(file_path), "Successfully processed CSV")
-            return {"PreHeaderText": pre_header_text, "Data": data, "Log": self.log_entries}
+            return {"PreHeaderText": pre_header_text, "Data": data, "Log": self._call_log}
             
         except Exception as e:
             self.create_log_entry("Process CSV", "FileProcessor", str(file_path), f"Error: {str(e)}")
-            return {"PreHeaderText": "", "Data": pd.DataFrame(), "Log": self.log_entries}
+            return {"PreHeaderText": "", "Data": pd.DataFrame(), "Log": self._call_log}
+    
+    def _read_csv_pandas(self, file_path: Union[str, Path], alt_names: List[str]) -> Tuple[str, pd.DataFrame]:
+        """Find the header row and read a CSV with pandas."""
+        # First read the top rows without headers to analyze, as Arrow strings when possible.
+        # Blank lines are kept so header_index counts raw rows, as the data readers skip them
+        probe_dtype = "string[pyarrow]" if PYARROW_AVAILABLE else str
+        data = pd.read_csv(self._source(file_path), header=None, nrows=HEADER_SCAN_ROWS, dtype=probe_dtype,
+                           engine="c", skip_blank_lines=False)
+        
+        # Find header row based on alternate names
+        header_index = 0
+        pattern = self._compile_alt_names(alt_names)
+        if pattern is not None:
+            header_index = self._find_header_row(data, pattern) or 0
+        
+        # Extract text above headers
+        pre_header_text = ""
+        quoted_line_breaks = False
+        if header_index > 0:
+            rows_above_header = data.iloc[:header_index].to_numpy(dtype=object)
+            pre_header_text = self._join_pre_header_cells(rows_above_header)
+            quoted_line_breaks = any(isinstance(cell, str) and ('\n' in cell or '\r' in cell)
+                                     for cell in rows_above_header.ravel())
+            
+        # Re-read with proper header
+        data = self._read_csv_data(file_path, header_index, quoted_line_breaks)
+        return pre_header_text, data
+    
+    def _read_csv_data(self, file_path: Union[str, Path], header_index: int,
+                       quoted_line_breaks: bool = False) -> pd.DataFrame:
+        """
+        Read the CSV rows from the header row onwards.
+        
+        header_index counts CSV rows, blank lines included. Uses pyarrow's
+        multi-threaded reader over a memory map (or the in-memory content) when
+        available, falling back to pandas for files Arrow cannot parse. Arrow
+        skips physical lines, so rows above the header with quoted line breaks
+        (quoted_line_breaks) are also left to pandas.
+        """
+        if PYARROW_AVAILABLE and not quoted_line_breaks:
+            try:
+                if self._content is not None:
+                    source = pa.BufferReader(self._content)
+                else:
+                    source = pa.memory_map(str(file_path), 'r')
+                with source:
+                    table = pa_csv.read_csv(source, read_options=pa_csv.ReadOptions(skip_rows=header_index))
+                return self._arrow_to_pandas(table)
+            except (pa.ArrowException, OSError, ValueError):
+                pass
+        
+        return pd.read_csv(self._source(file_path), skiprows=header_index)
+    
+    def _arrow_to_pandas(self, table: "pa.Table") -> pd.DataFrame:
+        """Convert an Arrow table to pandas with unique headers, skipping all-null columns."""
+        # Names are made unique first so suffixes match those assigned when empty columns are dropped later
+        table = table.rename_columns(self._make_unique_headers(table.column_names))
+        table = table.select([i for i, column in enumerate(table.columns) if column.null_count < table.num_rows])
+        # Let Arrow free each column as soon as it has been converted
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+    
+    def _process_columnar(self, file_path: Union[str, Path], alt_names: List[str]) -> Dict[str, Any]:
+        """
+        Process Parquet and Feather files.
+        
+        These formats store their column names in the schema, so no header
+        detection is needed and the file is read straight from a memory map.
+        Converting recurring Excel inputs to Parquet once skips Excel parsing
+        on every later run.
+        """
+        try:
+            if not PYARROW_AVAILABLE:
+                raise ImportError("pyarrow is required to read Parquet and Feather files")
+            
+            is_parquet = PurePath(file_path).suffix.lower() == '.parquet'
+            if self._content is not None:
+                source = pa.BufferReader(self._content)
+                table = pq.read_table(source) if is_parquet else pa_feather.read_table(source)
+            elif is_parquet:
+                table = pq.read_table(str(file_path), memory_map=True)
+            else:
+                table = pa_feather.read_table(str(file_path), memory_map=True)
+            data = self._arrow_to_pandas(table)
+            
+            self.create_log_entry("Process Columnar", "FileProcessor", str(file_path), "Successfully processed file")
+            return {"PreHeaderText": "", "Data": data, "Log": self._call_log}
+            
+        except Exception as e:
+            self.create_log_entry("Process Columnar", "FileProcessor", str(file_path), f"Error: {str(e)}")
+            return {"PreHeaderText": "", "Data": pd.DataFrame(), "Log": self._call_log}
+    
+    def _read_csv_polars(self, file_path: Union[str, Path], alt_names: List[str]) -> Tuple[str, pd.DataFrame]:
+        """Find the header row and read a CSV with polars, converting to pandas only at the end."""
+        header_index = 0
+        pre_header_text = ""
+        
+        if alt_names:
+            # Read the top rows as text and count alternate name matches per row in one vectorized pass
+            if self._content is not None:
+                raw = pl.read_csv(io.BytesIO(self._content), has_header=False, infer_schema_length=0, n_rows=HEADER_SCAN_ROWS)
+            else:
+                raw = pl.scan_csv(file_path, has_header=False, infer_schema_length=0).head(HEADER_SCAN_ROWS).collect()
+            pattern = "(?i)" + "|".join(_escape_rust_regex(alt) for alt in alt_names)
+            match_counts = raw.select(
+                pl.sum_horizontal([
+                    pl.col(col).str.contains(pattern).fill_null(False).cast(pl.UInt32)
+                    for col in raw.columns
+                ])
+            ).to_series()
+            
+            header_rows = (match_counts >= 3).arg_true()
+            if len(header_rows) > 0:
+                header_index = int(header_rows[0])
+            
+            # Extract text above headers
+            if header_index > 0:
+                pre_header_text = self._join_pre_header_cells(raw.head(header_index).to_numpy())
+        
+        # Infer types from every row: a column that turns to text after the first 100 rows
+        # would otherwise fail to parse
+        data = pl.read_csv(self._source(file_path), skip_rows=header_index, has_header=True,
+                           infer_schema_length=None)
+        
+        # Skip all-null columns before conversion to pandas
+        data.columns = self._make_unique_headers(data.columns)
+        data = data.select([series.name for series in data if series.null_count() < data.height])
+        return pre_header_text, data.to_pandas()
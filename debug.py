@@ -109,9 +109,10 @@ def create_test_file():
             "Amount": [125.50, 299.99, 750.00]
         }
         
+        # CSV keeps openpyxl out of the debug run; the harmonizer reads it like any other input
         df = pd.DataFrame(data)
-        file_path = test_dir / "sample_invoice.xlsx"
-        df.to_excel(file_path, index=False)
+        file_path = test_dir / "sample_invoice.csv"
+        df.to_csv(file_path, index=False)
         
         print(f"  ✓ Created sample file: {file_path}")
         
@@ -155,7 +156,7 @@ def test_run():
         from harmonizer_app import FinancialHarmonizer
         
         # Create test file if needed
-        test_file = Path(__file__).parent / "test_files" / "sample_invoice.xlsx"
+        test_file = Path(__file__).parent / "test_files" / "sample_invoice.csv"
         if not test_file.exists():
             create_test_file()
         
@@ -273,7 +274,7 @@ def main():
     
     print("\n=== Next Steps ===")
     print("1. If all checks passed, try running this command again:")
-    print("   python -m financial_harmonizer.cli process-file \"test_files/sample_invoice.xlsx\" ExampleVendor --output \"test_files2/output.csv\"")
+    print("   python -m financial_harmonizer.cli process-file \"test_files/sample_invoice.csv\" ExampleVendor --output \"test_files2/output.csv\"")
     print("\n2. If checks failed, fix the issues and run this debug script again")
 
 if __name__ == "__main__":
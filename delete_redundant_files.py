@@ -7,110 +7,165 @@ while preserving the essential UI components.
 import os
 import sys
 import shutil
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import logging
 import argparse
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("ui_cleanup.log"),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
+def _configure_logging():
+    """Set up console and ui_cleanup.log logging; done on first use so importing the module opens no files."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler("ui_cleanup.log"),
+            logging.StreamHandler()
+        ]
+    )
+
+# Core and redundant UI files, relative to the project root
+_CORE_UI_FILES = (
+    # Main application entry points
+    ("launcher.py", "Main unified entry point"),
+    ("streamlit_app.py", "Streamlit UI entry point"),
+    ("tkinter_app.py", "Tkinter UI entry point"),
+    
+    # UI component directories
+    ("ui/__init__.py", "Streamlit UI components initializer"),
+    ("ui/home.py", "Home page UI"),
+    ("ui/file_processor.py", "File processing UI"),
+    ("ui/provider_manager.py", "Provider management UI"),
+    ("ui/settings.py", "Settings UI"),
+    ("ui_tkinter/__init__.py", "Tkinter UI components initializer"),
+    ("ui_tkinter/app.py", "Tkinter application implementation")
+)
+
+_REDUNDANT_UI_FILES = (
+    # Redundant entry points and specialized files
+    ("simple_ui.py", "Outdated simple UI"),
+    ("simple_ui_fixed.py", "Generated fallback UI"),
+    ("ui_streamlit.py", "Old Streamlit entry point")
+)
+
+# Files that need review before deletion
+_SPECIALIZED_FILES = (
+    ("fix_ui.py", "UI repair tool with fallback functionality"),
+    ("provider_ui.py", "Standalone provider management UI"),
+    ("run_ui.py", "Streamlit installer and launcher")
+)
+
+@functools.lru_cache(maxsize=1)
 def get_project_root():
     """Get the project root directory."""
     return Path(__file__).parent
 
+def _existing_names(dir_path):
+    """Get the names of the entries in a directory with a single scandir pass."""
+    try:
+        with os.scandir(dir_path) as entries:
+            return {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
 def identify_redundant_files():
-    """Identify redundant UI files that can be removed."""
+    """Identify redundant UI files that can be removed (file paths are returned as Path objects)."""
     project_root = get_project_root()
     
-    # Define core and redundant UI files
-    core_ui_files = {
-        # Main application entry points
-        project_root / "launcher.py": "Main unified entry point",
-        project_root / "streamlit_app.py": "Streamlit UI entry point",
-        project_root / "tkinter_app.py": "Tkinter UI entry point",
-        
-        # UI component directories
-        project_root / "ui" / "__init__.py": "Streamlit UI components initializer",
-        project_root / "ui" / "home.py": "Home page UI",
-        project_root / "ui" / "file_processor.py": "File processing UI",
-        project_root / "ui" / "provider_manager.py": "Provider management UI",
-        project_root / "ui" / "settings.py": "Settings UI",
-        project_root / "ui_tkinter" / "__init__.py": "Tkinter UI components initializer",
-        project_root / "ui_tkinter" / "app.py": "Tkinter application implementation"
-    }
+    # Resolve the file tables against the project root
+    core_ui_files = {project_root / name: desc for name, desc in _CORE_UI_FILES}
+    redundant_ui_files = {project_root / name: desc for name, desc in _REDUNDANT_UI_FILES}
+    specialized_files = {project_root / name: desc for name, desc in _SPECIALIZED_FILES}
     
-    redundant_ui_files = {
-        # Redundant entry points and specialized files
-        project_root / "simple_ui.py": "Outdated simple UI",
-        project_root / "simple_ui_fixed.py": "Generated fallback UI",
-        project_root / "ui_streamlit.py": "Old Streamlit entry point"
+    # List each directory once instead of stat'ing every file
+    directories = {
+        file_path.parent
+        for files in (core_ui_files, redundant_ui_files, specialized_files)
+        for file_path in files
     }
+    existing_names = {directory: _existing_names(directory) for directory in directories}
     
-    # Files that need review before deletion
-    specialized_files = {
-        project_root / "fix_ui.py": "UI repair tool with fallback functionality",
-        project_root / "provider_ui.py": "Standalone provider management UI",
-        project_root / "run_ui.py": "Streamlit installer and launcher"
-    }
+    def exists(file_path):
+        # The name lookup is case-sensitive; on case-insensitive file systems (Windows, macOS)
+        # a differently-cased name still exists, so misses are confirmed with a stat
+        return file_path.name in existing_names[file_path.parent] or file_path.exists()
     
     # Verify existence of core files
     missing_core_files = []
     for file_path in core_ui_files:
-        if not file_path.exists():
+        if not exists(file_path):
             missing_core_files.append(file_path)
     
     # Check for redundant files
-    existing_redundant_files = []
-    for file_path in redundant_ui_files:
-        if file_path.exists():
-            existing_redundant_files.append(file_path)
+    existing_redundant_files = {}
+    for file_path, desc in redundant_ui_files.items():
+        if exists(file_path):
+            existing_redundant_files[file_path] = desc
     
     # Check specialized files
-    existing_specialized_files = []
-    for file_path in specialized_files:
-        if file_path.exists():
-            existing_specialized_files.append(file_path)
+    existing_specialized_files = {}
+    for file_path, desc in specialized_files.items():
+        if exists(file_path):
+            existing_specialized_files[file_path] = desc
     
     return {
-        "core_files": {str(k): v for k, v in core_ui_files.items()},
-        "missing_core_files": [str(f) for f in missing_core_files],
-        "redundant_files": {str(k): v for k, v in redundant_ui_files.items() if k in existing_redundant_files},
-        "specialized_files": {str(k): v for k, v in specialized_files.items() if k in existing_specialized_files}
+        "core_files": core_ui_files,
+        "missing_core_files": missing_core_files,
+        "redundant_files": existing_redundant_files,
+        "specialized_files": existing_specialized_files
     }
 
+def _backup_and_delete(file_path, backup_dir, backup_dev):
+    """
+    Back up (when backup_dir is given) and delete a single file.
+    
+    Returns:
+        Tuple of (path, success)
+    """
+    # identify_redundant_files already hands out Path objects
+    path = file_path if isinstance(file_path, Path) else Path(file_path)
+    try:
+        if backup_dir is not None:
+            backup_path = backup_dir / path.name
+            if os.stat(path).st_dev == backup_dev:
+                # Same filesystem: moving the file is the backup and the delete in one rename
+                os.replace(path, backup_path)
+                logger.info(f"Moved {path} to {backup_path}")
+                return path, True
+            
+            # Create backup; file metadata is not needed to restore it, so skip copystat
+            shutil.copyfile(path, backup_path)
+            logger.info(f"Backed up {path} to {backup_path}")
+        
+        # Delete the file
+        os.remove(path)
+        logger.info(f"Deleted {path}")
+        return path, True
+    except Exception as e:
+        logger.error(f"Failed to delete {path}: {e}")
+        return path, False
+
 def delete_files(files_to_delete, backup=True):
-    """Delete the specified files with optional backup."""
+    """Delete the specified files with optional backup, several files at a time."""
     results = {"success": [], "failed": []}
-    backup_dir = Path("./ui_backup")
+    if not files_to_delete:
+        return results
     
-    if backup and files_to_delete:
+    backup_dir = None
+    backup_dev = None
+    if backup:
+        backup_dir = Path("./ui_backup")
         os.makedirs(backup_dir, exist_ok=True)
         logger.info(f"Creating backup directory: {backup_dir}")
+        backup_dev = os.stat(backup_dir).st_dev
     
-    for file_path in files_to_delete:
-        path = Path(file_path)
-        try:
-            if backup:
-                # Create backup
-                backup_path = backup_dir / path.name
-                shutil.copy2(path, backup_path)
-                logger.info(f"Backed up {path} to {backup_path}")
-            
-            # Delete the file
-            os.remove(path)
-            logger.info(f"Deleted {path}")
-            results["success"].append(str(path))
-        except Exception as e:
-            logger.error(f"Failed to delete {path}: {e}")
-            results["failed"].append(str(path))
+    # File I/O releases the GIL, so threads overlap the copies and deletes
+    with ThreadPoolExecutor(max_workers=min(8, len(files_to_delete))) as executor:
+        outcomes = executor.map(lambda file_path: _backup_and_delete(file_path, backup_dir, backup_dev), files_to_delete)
+        for path, success in outcomes:
+            results["success" if success else "failed"].append(str(path))
     
     return results
 
@@ -166,12 +221,18 @@ The application selects a UI based on the following criteria:
 - Test both UIs when making significant changes
 """
     
-    with open(guide_path, 'w') as f:
-        f.write(content)
+    guide_path.write_text(content)
     
     logger.info(f"Created UI architecture guide: {guide_path}")
     return str(guide_path)
 
+def _flush_lines(lines):
+    """Write buffered console lines to stdout in one call and clear the buffer."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        lines.clear()
+
 def main():
     """Main function."""
     parser = argparse.ArgumentParser(description="Clean up redundant UI files")
@@ -183,86 +244,97 @@ def main():
     parser.set_defaults(backup=True)
     
     args = parser.parse_args()
+    _configure_logging()
     
-    print("============================================================")
-    print(" FINANCIAL HARMONIZER UI CLEANUP UTILITY")
-    print("============================================================")
-    print("")
-    print("This utility helps identify redundant UI files that can be safely removed.")
+    # Collect console output and write it in a few calls instead of one per line
+    lines = []
+    out = lines.append
+    
+    out("============================================================")
+    out(" FINANCIAL HARMONIZER UI CLEANUP UTILITY")
+    out("============================================================")
+    out("")
+    out("This utility helps identify redundant UI files that can be safely removed.")
     
     # Identify redundant files
     ui_files = identify_redundant_files()
     
-    print("")
-    print("============================================================")
-    print(" REDUNDANT FILES (SAFE TO DELETE)")
-    print("============================================================")
+    out("")
+    out("============================================================")
+    out(" REDUNDANT FILES (SAFE TO DELETE)")
+    out("============================================================")
     
     if ui_files["redundant_files"]:
         for file_path, description in ui_files["redundant_files"].items():
-            print(f"✗ {file_path} - {description}")
+            out(f"✗ {file_path} - {description}")
     else:
-        print("No redundant files found!")
+        out("No redundant files found!")
     
-    print("")
-    print("============================================================")
-    print(" SPECIALIZED FILES (REVIEW BEFORE DELETION)")
-    print("============================================================")
+    out("")
+    out("============================================================")
+    out(" SPECIALIZED FILES (REVIEW BEFORE DELETION)")
+    out("============================================================")
     
     if ui_files["specialized_files"]:
         for file_path, description in ui_files["specialized_files"].items():
-            print(f"⚠️ {file_path} - May be specialized, review before deletion")
+            out(f"⚠️ {file_path} - May be specialized, review before deletion")
     else:
-        print("No specialized files found!")
+        out("No specialized files found!")
     
-    print("")
-    print("============================================================")
-    print(" NEW UI STRUCTURE VERIFICATION")
-    print("============================================================")
+    out("")
+    out("============================================================")
+    out(" NEW UI STRUCTURE VERIFICATION")
+    out("============================================================")
     
     if ui_files["missing_core_files"]:
         for file_path in ui_files["missing_core_files"]:
-            print(f"✗ {file_path} - MISSING")
+            out(f"✗ {file_path} - MISSING")
     
+    # Reuse the existence checks from identify_redundant_files instead of stat'ing again
+    missing_core_files = set(ui_files["missing_core_files"])
     for file_path in ui_files["core_files"]:
-        if Path(file_path).exists():
-            print(f"✓ {file_path} - Present")
+        if file_path not in missing_core_files:
+            out(f"✓ {file_path} - Present")
         else:
-            print(f"✗ {file_path} - MISSING")
+            out(f"✗ {file_path} - MISSING")
     
     # Delete redundant files if requested
     if args.delete and ui_files["redundant_files"]:
-        print("")
-        print("Deleting redundant files...")
+        out("")
+        out("Deleting redundant files...")
+        _flush_lines(lines)
         results = delete_files(ui_files["redundant_files"], backup=args.backup)
         
-        print(f"Successfully deleted {len(results['success'])} files.")
+        out(f"Successfully deleted {len(results['success'])} files.")
         if results["failed"]:
-            print(f"Failed to delete {len(results['failed'])} files.")
+            out(f"Failed to delete {len(results['failed'])} files.")
             for file_path in results["failed"]:
-                print(f"  - {file_path}")
+                out(f"  - {file_path}")
     
     # Create architecture guide if requested
     if args.create_guide:
+        _flush_lines(lines)
         guide_path = create_ui_guide()
-        print(f"\nCreated UI architecture guide: {guide_path}")
+        out(f"\nCreated UI architecture guide: {guide_path}")
     
-    print("")
-    print("============================================================")
-    print(" SUMMARY")
-    print("============================================================")
+    out("")
+    out("============================================================")
+    out(" SUMMARY")
+    out("============================================================")
     
-    print(f"Redundant files: {len(ui_files['redundant_files'])}")
-    print(f"Specialized files: {len(ui_files['specialized_files'])}")
-    print(f"Missing core files: {len(ui_files['missing_core_files'])}")
+    out(f"Redundant files: {len(ui_files['redundant_files'])}")
+    out(f"Specialized files: {len(ui_files['specialized_files'])}")
+    out(f"Missing core files: {len(ui_files['missing_core_files'])}")
     
     if not args.delete and ui_files["redundant_files"]:
-        print("\nTo delete redundant files, run:")
-        print("python -m financial_harmonizer.delete_redundant_files --delete")
+        out("\nTo delete redundant files, run:")
+        out("python -m financial_harmonizer.delete_redundant_files --delete")
     
     if not args.create_guide:
-        print("\nTo create a UI architecture guide, run:")
-        print("python -m financial_harmonizer.delete_redundant_files --create-guide")
+        out("\nTo create a UI architecture guide, run:")
+        out("python -m financial_harmonizer.delete_redundant_files --create-guide")
+    
+    _flush_lines(lines)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
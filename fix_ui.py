@@ -7,13 +7,64 @@ import sys
 import subprocess
 from pathlib import Path
 import importlib
+import importlib.util
 import traceback
 import shutil
 
-def check_streamlit():
-    """Check if Streamlit is importable and working correctly."""
+# rmtree's error callback is called onexc from Python 3.12, where onerror is deprecated
+_RMTREE_ERROR_KWARG = "onexc" if sys.version_info >= (3, 12) else "onerror"
+
+def _report_rmtree_error(func, path, exc):
+    """Report a path rmtree could not remove and carry on with the rest of the tree."""
+    # onerror passes sys.exc_info() while onexc passes the exception itself
+    error = exc[1] if isinstance(exc, tuple) else exc
+    print(f"   Failed to remove {path}: {error}")
+
+def _find_pycache(root, name_prefix=""):
+    """
+    Recursively find __pycache__ directories below root with os.scandir.
+    
+    Directory checks use the cached DirEntry type, so no extra stat calls are made.
+    Only __pycache__ directories inside a directory whose name starts with
+    name_prefix are returned; such directories are matched at any depth.
+    """
+    try:
+        with os.scandir(root) as entries:
+            subdirs = [entry for entry in entries if entry.is_dir(follow_symlinks=False)]
+    except OSError:
+        return
+    
+    for entry in subdirs:
+        if entry.name == "__pycache__":
+            if not name_prefix:
+                yield entry.path
+        elif entry.name.startswith(name_prefix):
+            # Everything below a matching directory is included
+            yield from _find_pycache(entry.path)
+        else:
+            yield from _find_pycache(entry.path, name_prefix)
+
+def check_streamlit(verify_import=False):
+    """
+    Check if Streamlit is importable and working correctly.
+    
+    Args:
+        verify_import: Also import Streamlit in a subprocess to catch broken installs
+                       (e.g. circular imports); by default only check that it is installed
+    """
     print("Checking Streamlit installation...")
     
+    # Finding the package spec is instant and rules out a missing install without a subprocess;
+    # finder caches are reset first as pip may have just (re)installed it
+    importlib.invalidate_caches()
+    if importlib.util.find_spec("streamlit") is None:
+        print("✗ Streamlit is not installed")
+        return False
+    
+    if not verify_import:
+        print("✓ Streamlit is installed")
+        return True
+    
     try:
         # Try to import streamlit - but do it in a separate process to avoid affecting our current environment
         result = subprocess.run(
@@ -38,36 +89,26 @@ def fix_streamlit():
     print("\nAttempting to fix Streamlit installation...")
     
     try:
-        # Uninstall current streamlit
-        print("1. Uninstalling current Streamlit...")
-        subprocess.check_call([
-            sys.executable, "-m", "pip", "uninstall", "-y", "streamlit"
-        ])
-        
         # Remove any cached files
-        print("2. Clearing Python cache directories...")
+        print("1. Clearing Python cache directories...")
         for directory in sys.path:
             if os.path.isdir(directory):
-                for root, dirs, files in os.walk(directory):
-                    for d in dirs:
-                        if d == "__pycache__" and "streamlit" in root:
-                            pycache_dir = os.path.join(root, d)
-                            print(f"   Removing {pycache_dir}")
-                            try:
-                                shutil.rmtree(pycache_dir)
-                            except Exception as e:
-                                print(f"   Failed to remove {pycache_dir}: {e}")
-        
-        # Install a specific version known to work well
-        print("3. Installing Streamlit 1.22.0 (known stable version)...")
+                # Only caches inside streamlit* directories, at any depth, are removed
+                for pycache_dir in list(_find_pycache(directory, name_prefix="streamlit")):
+                    print(f"   Removing {pycache_dir}")
+                    shutil.rmtree(pycache_dir, **{_RMTREE_ERROR_KWARG: _report_rmtree_error})
+        
+        # Replace the current install with a specific version known to work well;
+        # one forced reinstall does the uninstall and install in a single pip run
+        print("2. Reinstalling Streamlit 1.22.0 (known stable version)...")
         subprocess.check_call([
-            sys.executable, "-m", "pip", "install", "streamlit==1.22.0"
+            sys.executable, "-m", "pip", "install", "--force-reinstall", "streamlit==1.22.0"
         ])
         
         print("✓ Streamlit reinstallation complete")
         
-        # Check if fixed
-        if check_streamlit():
+        # Check if fixed; the import itself is what was broken, so try it
+        if check_streamlit(verify_import=True):
             return True
         else:
             print("✗ Streamlit still has issues after reinstallation")
@@ -92,8 +133,7 @@ def run_streamlit_in_isolation():
     try:
         # Create a minimal launcher script
         launcher_path = current_dir / "streamlit_launcher.py"
-        with open(launcher_path, "w") as f:
-            f.write("""
+        launcher_path.write_text("""
 # Simple launcher to avoid circular imports
 import subprocess
 import sys
@@ -136,12 +176,8 @@ subprocess.run([
         traceback.print_exc()
         return False
 
-def run_tkinter_ui():
-    """Launch the Tkinter UI as fallback."""
-    print("\nLaunching fallback Tkinter UI for Financial Data Harmonizer...")
-    
-    # We'll create a very simple UI if needed
-    simple_ui_code = """
+# Source of the simple fallback UI written out by run_tkinter_ui
+_SIMPLE_UI_CODE = """
 import os
 import sys
 import tkinter as tk
@@ -173,14 +209,15 @@ class SimpleHarmonizerUI:
         if harmonizer_available:
             self.harmonizer = FinancialHarmonizer()
             try:
-                self.provider_config = ProviderConfig()
-                self.providers = list(self.provider_config.providers_cache.keys())
+                # Share the harmonizer's provider configs instead of loading them again
+                self.provider_config = self.harmonizer.provider_config
+                self.providers = tuple(self.provider_config.providers_cache)
             except:
-                self.providers = ["ExampleVendor"]
+                self.providers = ("ExampleVendor",)
         else:
             self.harmonizer = None
             self.provider_config = None
-            self.providers = ["ExampleVendor"]
+            self.providers = ("ExampleVendor",)
         
         self.create_ui()
         
@@ -378,13 +415,16 @@ def main():
 if __name__ == "__main__":
     main()
 """
+
+def run_tkinter_ui():
+    """Launch the Tkinter UI as fallback."""
+    print("\nLaunching fallback Tkinter UI for Financial Data Harmonizer...")
     
     # Create the fallback UI file
     simple_ui_path = Path(__file__).parent / "simple_ui_fixed.py"
     
     try:
-        with open(simple_ui_path, 'w') as f:
-            f.write(simple_ui_code)
+        simple_ui_path.write_text(_SIMPLE_UI_CODE)
             
         print(f"Created fallback UI at {simple_ui_path}")
         
@@ -422,8 +462,8 @@ def main():
     # Fix Python path
     fix_python_path()
     
-    # Try the streamlit approach first
-    streamlit_working = check_streamlit()
+    # Try the streamlit approach first; this tool exists to catch broken imports, so try one
+    streamlit_working = check_streamlit(verify_import=True)
     
     if not streamlit_working:
         print("\nStreamlit has issues. Would you like to attempt to fix it? (y/n)")
@@ -1,11 +1,15 @@
 import os
 import json
 import pandas as pd
+import numpy as np
 import datetime
-from typing import Dict, List, Any, Optional, Union
+import multiprocessing
+import multiprocessing.pool
+from typing import Dict, List, Any, Optional, Union, Callable, Tuple
 from pathlib import Path
 import logging
 import warnings
+from pandas.api.types import union_categoricals
 
 # Import our modules
 from config.providers import ProviderConfig
@@ -20,6 +24,324 @@ try:
 except ImportError:
     warnings.warn("SharePoint integration unavailable: shareplum package not installed")
 
+# pyarrow is optional; it provides a much faster CSV writer than pandas and
+# a cheap way to move frames out of worker processes
+PYARROW_AVAILABLE = False
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.ipc
+    PYARROW_AVAILABLE = True
+    # concat_tables replaced its promote flag with promote_options in pyarrow 14
+    _ARROW_PROMOTE = {'promote_options': 'default'} if int(pa.__version__.split('.')[0]) >= 14 else {'promote': True}
+except ImportError:
+    pass
+
+# orjson is optional; it writes the export log much faster than the stdlib encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pyahocorasick is optional; it matches large provider mappings in one pass per file name
+AHOCORASICK_AVAILABLE = False
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    pass
+
+# Below this many patterns the regex alternation is just as fast
+AHOCORASICK_MIN_PATTERNS = 20
+
+_now = datetime.datetime.now
+
+# File types harmonized when processing a directory, in processing order
+DATA_FILE_EXTENSIONS = ('.xlsx', '.xls', '.csv', '.parquet', '.feather')
+
+def find_data_files(directory_path: Union[str, Path]) -> List[Path]:
+    """
+    Recursively find all supported data files below a directory.
+    
+    Walks the tree with an explicit os.scandir stack, so each directory is
+    listed once and file types come from DirEntry data without extra stat
+    calls. Like Path.glob('**'), symlinked directories are not followed.
+    
+    Args:
+        directory_path: Directory to search
+        
+    Returns:
+        List of file paths, grouped by extension in DATA_FILE_EXTENSIONS order
+    """
+    found = {ext: [] for ext in DATA_FILE_EXTENSIONS}
+    stack = [os.fspath(directory_path)]
+    
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        ext = os.path.splitext(entry.name)[1].lower()
+                        if ext in found:
+                            found[ext].append(Path(entry.path))
+        except PermissionError:
+            continue
+    
+    return [file_path for ext in DATA_FILE_EXTENSIONS for file_path in found[ext]]
+
+def compile_provider_mapping(provider_mapping: Dict[str, str]) -> Callable[[str], Optional[str]]:
+    """
+    Compile a mapping of filename patterns to provider names into a single matcher.
+    
+    Patterns are plain substrings tried in mapping order, so the first pattern
+    contained in the file name wins, exactly like looping over the mapping.
+    Large mappings use an Aho-Corasick automaton when pyahocorasick is installed.
+    File names equal to a pattern are resolved with a dict lookup.
+    
+    Args:
+        provider_mapping: Mapping of file name patterns to provider names
+        
+    Returns:
+        Function returning the provider name for a file name, or None
+    """
+    if not provider_mapping:
+        return lambda file_name: None
+    
+    providers = list(provider_mapping.values())
+    
+    if AHOCORASICK_AVAILABLE and len(provider_mapping) >= AHOCORASICK_MIN_PATTERNS:
+        # Scan the name once for all patterns; the earliest pattern in mapping order wins
+        automaton = ahocorasick.Automaton()
+        empty_index = None
+        for index, pattern in enumerate(provider_mapping):
+            if pattern:
+                automaton.add_word(pattern, index)
+            elif empty_index is None:
+                # An empty pattern is contained in every name
+                empty_index = index
+        automaton.make_automaton()
+        
+        def scan(file_name: str) -> Optional[str]:
+            best = empty_index
+            for _, index in automaton.iter(file_name):
+                if best is None or index < best:
+                    best = index
+            return providers[best] if best is not None else None
+    else:
+        # Few patterns or no pyahocorasick: a plain substring loop in mapping order
+        # is fastest, since each test is a single C-level search
+        items = list(provider_mapping.items())
+        
+        def scan(file_name: str) -> Optional[str]:
+            for pattern, provider_name in items:
+                if pattern in file_name:
+                    return provider_name
+            return None
+    
+    # Patterns are often whole file names; their scan result is computed once, so
+    # an earlier pattern contained in the name still takes precedence
+    exact = {pattern: scan(pattern) for pattern in provider_mapping}
+    
+    def match_provider(file_name: str) -> Optional[str]:
+        provider_name = exact.get(file_name)
+        return provider_name if provider_name is not None else scan(file_name)
+    
+    return match_provider
+
+def _concat_same_schema(frames: List[pd.DataFrame]) -> Optional[pd.DataFrame]:
+    """
+    Concatenate frames sharing the same columns and NumPy dtypes column by column.
+    
+    Each column is joined with a single np.concatenate, skipping the dtype
+    unification and block consolidation done by pd.concat. Categorical columns,
+    such as the per-file metadata columns, are joined with union_categoricals.
+    
+    Args:
+        frames: Frames to concatenate, in order
+        
+    Returns:
+        The concatenated frame with a fresh RangeIndex, or None if the frames
+        differ in columns or dtypes (or use other extension dtypes)
+    """
+    columns = frames[0].columns
+    dtypes = frames[0].dtypes
+    if columns.has_duplicates:
+        return None
+    categorical = [isinstance(dtype, pd.CategoricalDtype) for dtype in dtypes]
+    if not all(is_cat or isinstance(dtype, np.dtype) for is_cat, dtype in zip(categorical, dtypes)):
+        return None
+    for frame in frames[1:]:
+        if not frame.columns.equals(columns):
+            return None
+        for is_cat, dtype, first in zip(categorical, frame.dtypes, dtypes):
+            # Categories may differ between frames; union_categoricals merges them
+            if is_cat != isinstance(dtype, pd.CategoricalDtype) or (not is_cat and dtype != first):
+                return None
+    
+    data = {}
+    try:
+        for is_cat, column in zip(categorical, columns):
+            if is_cat:
+                data[column] = union_categoricals([frame[column] for frame in frames])
+            else:
+                data[column] = np.concatenate([frame[column].to_numpy() for frame in frames])
+    except TypeError:
+        # Categories of different types (or ordered categoricals) need pd.concat
+        return None
+    return pd.DataFrame(data, columns=columns, copy=False)
+
+def _constant_column(value: str, length: int) -> pd.Categorical:
+    """Build a column repeating one value, stored as int8 codes into a single category."""
+    return pd.Categorical.from_codes(np.zeros(length, dtype=np.int8), categories=[value])
+
+def _fast_concat(frames: List[pd.DataFrame], ignore_index: bool = True) -> pd.DataFrame:
+    """
+    Concatenate frames, avoiding pd.concat where a cheaper path exists.
+    
+    A single frame is returned as-is (re-indexed only if needed) and frames
+    sharing a schema are joined with _concat_same_schema. Columns that are
+    categorical in the inputs stay categorical on every path.
+    
+    Args:
+        frames: Frames to concatenate, in order
+        ignore_index: Give the result a fresh RangeIndex
+        
+    Returns:
+        The concatenated frame
+    """
+    if len(frames) == 1:
+        frame = frames[0]
+        if ignore_index and not frame.index.equals(pd.RangeIndex(len(frame))):
+            return frame.reset_index(drop=True)
+        return frame
+    
+    if ignore_index:
+        # Files of the same provider share a schema and can be joined column by column
+        merged = _concat_same_schema(frames)
+        if merged is not None:
+            return merged
+    
+    merged = pd.concat(frames, ignore_index=ignore_index)
+    
+    # pd.concat turns categoricals with differing categories into plain values
+    categorical_columns = {
+        column for frame in frames
+        for column, dtype in frame.dtypes.items() if isinstance(dtype, pd.CategoricalDtype)
+    }
+    for column in categorical_columns:
+        if not isinstance(merged[column].dtype, pd.CategoricalDtype):
+            merged[column] = merged[column].astype('category')
+    return merged
+
+class _OrderedCsvStream:
+    """
+    Append harmonized frames to one CSV file in task order as results arrive.
+    
+    Results arriving ahead of their turn are held until the earlier ones have
+    been written, so the file matches the row order of an in-memory run. The
+    first frame written sets the header; later frames are aligned to its
+    columns, with columns missing from the header dropped (and logged).
+    """
+    
+    def __init__(self, output_path: Union[str, Path], logger: logging.Logger):
+        self.output_path = output_path
+        self.logger = logger
+        self.columns = None
+        self.rows = 0
+        self._next_index = 0
+        self._waiting = {}
+    
+    def add(self, index: int, result: Dict[str, Any]) -> None:
+        """Take a task result, writing its frame (and any it unblocks) once its turn comes."""
+        self._waiting[index] = result
+        while self._next_index in self._waiting:
+            ready = self._waiting.pop(self._next_index)
+            self._next_index += 1
+            if ready.get('success', False):
+                # The frame is on disk afterwards, so the result no longer keeps it in memory
+                self._write(ready.pop('data'), ready.get('file_name', ''))
+    
+    def _write(self, frame: pd.DataFrame, file_name: str) -> None:
+        """Append a frame to the CSV, writing the header with the first one."""
+        # Files without rows (e.g. failed reads) must not set the header
+        if len(frame) == 0:
+            return
+        if self.columns is None:
+            self.columns = frame.columns
+            frame.to_csv(self.output_path, index=False)
+        else:
+            if not frame.columns.equals(self.columns):
+                dropped = [column for column in frame.columns if column not in self.columns]
+                if dropped:
+                    self.logger.warning("Streaming %s: dropping columns not in the output header: %s", file_name, dropped)
+                frame = frame.reindex(columns=self.columns)
+            frame.to_csv(self.output_path, index=False, mode='a', header=False)
+        self.rows += len(frame)
+
+# Fewer files than this are harmonized serially, since starting worker processes and
+# loading their configuration costs more than it saves
+POOL_MIN_FILES = 4
+
+# Harmonizer used by pool worker processes, created once per worker so the
+# configuration is only loaded once
+_worker_harmonizer = None
+
+def _worker_init(config_path: Optional[str]) -> None:
+    """Pool initializer building the worker's harmonizer up front."""
+    global _worker_harmonizer
+    _worker_harmonizer = FinancialHarmonizer(config_path=config_path)
+
+def create_pool(processes: Optional[int] = None, config_path: Optional[str] = None) -> multiprocessing.pool.Pool:
+    """
+    Create a worker pool for harmonizing files.
+    
+    The pool can be passed to several process_directory/process_sharepoint_folder
+    calls so worker start-up and config loading are only paid once. Workers are
+    spawned rather than forked: forking after pyarrow or polars have started
+    their thread pools can deadlock the workers.
+    
+    Args:
+        processes: Number of worker processes (defaults to the CPU count)
+        config_path: Path to configuration file used by the workers
+        
+    Returns:
+        A multiprocessing pool, to be closed by the caller
+    """
+    return multiprocessing.get_context("spawn").Pool(
+        processes or os.cpu_count() or 1,
+        initializer=_worker_init,
+        initargs=(str(config_path) if config_path else None,)
+    )
+
+def _process_one(task: Tuple[int, str, str, Optional[str], Optional[bytes]]) -> Tuple[int, Dict[str, Any]]:
+    """
+    Harmonize a single file inside a pool worker process.
+    
+    Args:
+        task: Tuple of (task index, file path, provider name, config path, in-memory content)
+        
+    Returns:
+        Tuple of (task index, processing result)
+    """
+    global _worker_harmonizer
+    index, file_path, provider_name, config_path, content = task
+    if _worker_harmonizer is None:
+        _worker_harmonizer = FinancialHarmonizer(config_path=config_path)
+    result = _worker_harmonizer._harmonize_file(file_path, provider_name, content)
+    
+    # Send the frame back as an Arrow IPC buffer rather than pickling its blocks
+    if PYARROW_AVAILABLE and result['success']:
+        try:
+            result['arrow_data'] = pa.ipc.serialize_pandas(result['data'], preserve_index=False).to_pybytes()
+            del result['data']
+        except (pa.ArrowException, TypeError, ValueError):
+            pass
+    
+    return index, result
+
 class FinancialHarmonizer:
     """
     Main application class that orchestrates the entire data harmonization process.
@@ -33,13 +355,16 @@ class FinancialHarmonizer:
             config_path: Path to configuration file
         """
         # Set up logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
+        # Only configure the root logger when the application has not done so already
+        if not logging.getLogger().handlers:
+            logging.basicConfig(
+                level=logging.INFO,
+                format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            )
         self.logger = logging.getLogger('FinancialHarmonizer')
         
         # Load config 
+        self.config_path = config_path
         self.config = {}
         if config_path and os.path.exists(config_path):
             with open(config_path, 'r') as f:
@@ -47,7 +372,8 @@ class FinancialHarmonizer:
         
         # Initialize components
         self.provider_config = ProviderConfig()
-        self.file_processor = FileProcessor()
+        # Per-file logs are collected into master_log, so the processor keeps no history of its own
+        self.file_processor = FileProcessor(max_log_entries=0)
         self.transform_pipeline = TransformPipeline()
         
         # Initialize SharePoint connector if needed and available
@@ -72,18 +398,77 @@ class FinancialHarmonizer:
         self.master_data = None
         self.master_log = []
     
-    def process_file(self, file_path: Union[str, Path], provider_name: str) -> Dict[str, Any]:
+    @property
+    def master_data(self) -> Optional[pd.DataFrame]:
+        """Combined data of all processed files, concatenated once when first read after new files."""
+        if self._pending_frames:
+            self._materialize_master()
+        return self._master_data
+    
+    @master_data.setter
+    def master_data(self, value: Optional[pd.DataFrame]) -> None:
+        self._master_data = value
+        self._pending_frames = []
+    
+    @property
+    def has_data(self) -> bool:
+        """Whether any harmonized rows are held, checked without merging pending frames."""
+        return any(not frame.empty for frame in self._master_frames())
+    
+    def _master_frames(self) -> List[pd.DataFrame]:
+        """Frames making up the master data, in order, without concatenating pending ones."""
+        frames = list(self._pending_frames)
+        if self._master_data is not None:
+            frames.insert(0, self._master_data)
+        return frames
+    
+    def _materialize_master(self) -> None:
+        """Merge frames of newly processed files into the master data with a single concat."""
+        frames = self._master_frames()
+        self._pending_frames = []
+        
+        self._master_data = _fast_concat(frames)
+    
+    def process_file(self, file_path: Union[str, Path], provider_name: str,
+                     content: Optional[bytes] = None) -> Dict[str, Any]:
         """
         Process a file with the specified provider configuration.
         
         Args:
-            file_path: Path to the file
+            file_path: Path to the file, or just its name when content is given
             provider_name: Name of the provider configuration to use
+            content: Optional file content already in memory, parsed instead of reading file_path
             
         Returns:
             Dictionary with processing results and logs
         """
-        self.logger.info(f"Processing file {file_path} with provider {provider_name}")
+        result = self._harmonize_file(file_path, provider_name, content)
+        self._record_result(file_path, provider_name, result)
+        
+        # Queue the frame for the master data; it is concatenated once when next read
+        if result['success']:
+            self._pending_frames.append(result['data'])
+        
+        return result
+    
+    def _harmonize_file(self, file_path: Union[str, Path], provider_name: str,
+                        content: Optional[bytes] = None) -> Dict[str, Any]:
+        """
+        Run a file through the processing and transformation pipeline.
+        
+        Unlike process_file this does not touch the tracking variables or
+        master data, so it can be run in a worker process.
+        
+        Args:
+            file_path: Path to the file, or just its name when content is given
+            provider_name: Name of the provider configuration to use
+            content: Optional file content already in memory
+            
+        Returns:
+            Dictionary with processing results and logs
+        """
+        self.logger.info("Processing file %s with provider %s", file_path, provider_name)
+        file_name = os.path.basename(file_path)
         
         try:
             # Get provider settings
@@ -92,7 +477,8 @@ class FinancialHarmonizer:
             # Process file
             file_result = self.file_processor.process_file(
                 file_path=file_path,
-                synonyms=provider_settings.get('Synonyms', [])
+                synonyms=provider_settings.get('Synonyms', []),
+                content=content
             )
             
             # Extract data and metadata
@@ -100,9 +486,6 @@ class FinancialHarmonizer:
             df = file_result.get('Data', pd.DataFrame())
             logs = file_result.get('Log', [])
             
-            # Add file metadata
-            file_name = os.path.basename(file_path)
-            
             # Apply transformation pipeline
             # 1. Apply synonyms
             synonym_result = self.transform_pipeline.apply_synonyms(
@@ -145,27 +528,11 @@ class FinancialHarmonizer:
             df = extract_result.get('ResultTable', df)
             logs.extend(extract_result.get('Log', []))
             
-            # Add file metadata columns
-            df['provider_name'] = provider_name
-            df['file_name'] = file_name
-            df['processed_date'] = datetime.datetime.now().isoformat()
-            
-            # Track this file as processed
-            self.processed_files.append({
-                'file_path': str(file_path),
-                'provider_name': provider_name,
-                'row_count': len(df),
-                'success': True
-            })
-            
-            # Update master data
-            if self.master_data is None:
-                self.master_data = df
-            else:
-                self.master_data = pd.concat([self.master_data, df], ignore_index=True)
-                
-            # Update master log
-            self.master_log.extend(logs)
+            # Add file metadata columns; each holds one value per file, so they are
+            # stored as single-category categoricals instead of a string per row
+            df['provider_name'] = _constant_column(provider_name, len(df))
+            df['file_name'] = _constant_column(file_name, len(df))
+            df['processed_date'] = _constant_column(_now().isoformat(), len(df))
             
             return {
                 'success': True,
@@ -180,32 +547,63 @@ class FinancialHarmonizer:
             error_msg = f"Error processing file {file_path}: {str(e)}"
             self.logger.error(error_msg)
             
-            # Track this file as failed
-            self.errors.append({
-                'file_path': str(file_path),
-                'provider_name': provider_name,
-                'error': error_msg
-            })
-            
             return {
                 'success': False,
                 'error': error_msg,
-                'file_name': os.path.basename(file_path),
+                'file_name': file_name,
                 'provider_name': provider_name
             }
     
-    def process_directory(self, directory_path: Union[str, Path], provider_mapping: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    def _record_result(self, file_path: Union[str, Path], provider_name: str, result: Dict[str, Any]) -> None:
+        """Track a file result in processed_files/errors and the master log."""
+        if result['success']:
+            # Track this file as processed
+            self.processed_files.append({
+                'file_path': str(file_path),
+                'provider_name': provider_name,
+                'row_count': result['row_count'],
+                'success': True
+            })
+            
+            # Update master log
+            self.master_log.extend(result['log'])
+        else:
+            # Track this file as failed
+            self.errors.append({
+                'file_path': str(file_path),
+                'provider_name': provider_name,
+                'error': result['error']
+            })
+    
+    def process_directory(self, directory_path: Union[str, Path], provider_mapping: Optional[Dict[str, str]] = None,
+                          processes: Optional[int] = 1,
+                          progress_callback: Optional[Callable[[int, int], None]] = None,
+                          pool: Optional[multiprocessing.pool.Pool] = None,
+                          streaming_output_path: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
         """
         Process all compatible files in a directory.
         
+        Files are harmonized serially by default, or in parallel with a
+        multiprocessing pool when processes > 1 (or a pool is given); the
+        resulting frames are merged into the master data once at the end.
+        With streaming_output_path, each frame is instead appended to that CSV
+        as soon as it is ready and is not kept, so memory does not grow with
+        the number of files; the master data is left unchanged and the results
+        carry no 'data'. Files should share a schema: the first file's columns
+        form the CSV header.
+        
         Args:
             directory_path: Path to the directory
             provider_mapping: Optional mapping of file patterns to provider names
+            processes: Number of worker processes (defaults to 1, running serially; None uses the CPU count)
+            progress_callback: Optional callable receiving (completed, total) after each file
+            pool: Optional pool from create_pool to reuse instead of starting a new one
+            streaming_output_path: Optional CSV path to write harmonized rows to incrementally
             
         Returns:
             Summary of processing results
         """
-        self.logger.info(f"Processing directory {directory_path}")
+        self.logger.info("Processing directory %s", directory_path)
         
         directory_path = Path(directory_path)
         if not directory_path.exists() or not directory_path.is_dir():
@@ -216,45 +614,39 @@ class FinancialHarmonizer:
         # Default mapping uses filename patterns
         if provider_mapping is None:
             provider_mapping = {}
+        match_provider = compile_provider_mapping(provider_mapping)
         
-        # Find all Excel and CSV files
-        files = list(directory_path.glob("**/*.xlsx"))
-        files.extend(directory_path.glob("**/*.xls"))
-        files.extend(directory_path.glob("**/*.csv"))
+        # Find all supported data files
+        files = find_data_files(directory_path)
         
         if not files:
-            self.logger.warning(f"No compatible files found in {directory_path}")
+            self.logger.warning("No compatible files found in %s", directory_path)
             return {'success': True, 'processed': 0, 'errors': 0, 'files': []}
         
-        processed_count = 0
-        error_count = 0
-        results = []
-        
+        # Resolve the provider for each file up front
+        tasks = []
         for file_path in files:
             file_name = file_path.name
             
             # Determine provider for this file
-            provider_name = None
-            for pattern, provider in provider_mapping.items():
-                if pattern in file_name:
-                    provider_name = provider
-                    break
+            provider_name = match_provider(file_name)
             
             # Skip if no provider mapping
             if not provider_name:
-                self.logger.warning(f"Skipping file {file_name} - no provider mapping found")
+                self.logger.warning("Skipping file %s - no provider mapping found", file_name)
                 continue
             
-            # Process the file
-            result = self.process_file(file_path, provider_name)
-            results.append(result)
-            
-            if result.get('success', False):
-                processed_count += 1
-            else:
-                error_count += 1
+            tasks.append((len(tasks), str(file_path), provider_name, self.config_path, None))
         
-        return {
+        stream = None
+        if streaming_output_path is not None:
+            stream = _OrderedCsvStream(streaming_output_path, self.logger)
+        
+        indexed_results = self._run_tasks(tasks, processes, progress_callback, pool,
+                                          on_result=stream.add if stream is not None else None)
+        processed_count, error_count, results = self._collect_results(tasks, indexed_results)
+        
+        summary = {
             'success': True,
             'processed': processed_count,
             'errors': error_count,
@@ -262,14 +654,115 @@ class FinancialHarmonizer:
             'skipped': len(files) - processed_count - error_count,
             'results': results
         }
+        if stream is not None:
+            summary['output_path'] = str(streaming_output_path)
+            summary['rows_written'] = stream.rows
+        return summary
     
-    def process_sharepoint_folder(self, folder_path: str, provider_mapping: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    def _run_tasks(self, tasks: List[Tuple[int, str, str, Optional[str], Optional[bytes]]], processes: Optional[int] = None,
+                   progress_callback: Optional[Callable[[int, int], None]] = None,
+                   pool: Optional[multiprocessing.pool.Pool] = None,
+                   on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        Harmonize a list of file tasks, using a process pool when worthwhile.
+        
+        Without a pool, one is only started for at least POOL_MIN_FILES tasks,
+        sized to the number of tasks.
+        
+        Args:
+            tasks: List of (task index, file path, provider name, config path, content) tuples
+            processes: Number of worker processes (None uses the CPU count)
+            progress_callback: Optional callable receiving (completed, total) after each file
+            pool: Optional existing pool to run the tasks on
+            on_result: Optional callable receiving (task index, result) as each file completes
+            
+        Returns:
+            List of (task index, result) tuples in completion order
+        """
+        total = len(tasks)
+        indexed_results = []
+        
+        if progress_callback:
+            progress_callback(0, total)
+        
+        if pool is None:
+            processes = min(processes or os.cpu_count() or 1, total)
+            if processes > 1 and total >= POOL_MIN_FILES:
+                with create_pool(processes, self.config_path) as own_pool:
+                    return self._run_tasks(tasks, processes, progress_callback, own_pool, on_result)
+            
+            for index, file_path, provider_name, _, content in tasks:
+                result = self._harmonize_file(file_path, provider_name, content)
+                if on_result:
+                    on_result(index, result)
+                indexed_results.append((index, result))
+                if progress_callback:
+                    progress_callback(len(indexed_results), total)
+            return indexed_results
+        
+        chunksize = max(1, total // ((processes or os.cpu_count() or 1) * 4))
+        for index, result in pool.imap_unordered(_process_one, tasks, chunksize=chunksize):
+            if 'arrow_data' in result:
+                result['data'] = pa.ipc.deserialize_pandas(result.pop('arrow_data'))
+            if on_result:
+                on_result(index, result)
+            indexed_results.append((index, result))
+            if progress_callback:
+                progress_callback(len(indexed_results), total)
+        
+        return indexed_results
+    
+    def _collect_results(self, tasks: List[Tuple[int, str, str, Optional[str], Optional[bytes]]],
+                         indexed_results: List[Tuple[int, Dict[str, Any]]]) -> Tuple[int, int, List[Dict[str, Any]]]:
+        """
+        Record task results in task order and queue their frames for the master data.
+        
+        Args:
+            tasks: The tasks that were run
+            indexed_results: List of (task index, result) tuples from _run_tasks
+            
+        Returns:
+            Tuple of (processed count, error count, results in task order)
+        """
+        processed_count = 0
+        error_count = 0
+        results = []
+        frames = []
+        
+        for index, result in sorted(indexed_results, key=lambda item: item[0]):
+            _, file_path, provider_name, _, _ = tasks[index]
+            self._record_result(file_path, provider_name, result)
+            results.append(result)
+            
+            if result.get('success', False):
+                processed_count += 1
+                # Streamed results have already been written out and carry no frame
+                if 'data' in result:
+                    frames.append(result['data'])
+            else:
+                error_count += 1
+        
+        # Queue the harmonized frames; they are merged into the master data in one go when next read
+        self._pending_frames.extend(frames)
+        
+        return processed_count, error_count, results
+    
+    def process_sharepoint_folder(self, folder_path: str, provider_mapping: Optional[Dict[str, str]] = None,
+                                  processes: Optional[int] = 1,
+                                  progress_callback: Optional[Callable[[int, int], None]] = None,
+                                  pool: Optional[multiprocessing.pool.Pool] = None) -> Dict[str, Any]:
         """
         Process files from a SharePoint folder.
         
+        Downloaded files are harmonized straight from memory, without being
+        staged on disk, serially or in parallel like process_directory.
+        
         Args:
             folder_path: Path to SharePoint folder
             provider_mapping: Optional mapping of file patterns to provider names
+            processes: Number of worker processes (defaults to 1, running serially; None uses the CPU count)
+            progress_callback: Optional callable receiving (completed, total) after each file
+            pool: Optional pool from create_pool to reuse instead of starting a new one
             
         Returns:
             Summary of processing results
@@ -284,7 +777,7 @@ class FinancialHarmonizer:
             self.logger.error(error_msg)
             return {'success': False, 'error': error_msg}
             
-        self.logger.info(f"Processing SharePoint folder {folder_path}")
+        self.logger.info("Processing SharePoint folder %s", folder_path)
         
         # Get files from SharePoint
         result = self.sharepoint.get_files(
@@ -297,66 +790,37 @@ class FinancialHarmonizer:
         self.master_log.extend(logs)
         
         if not files:
-            self.logger.warning(f"No compatible files found in SharePoint folder {folder_path}")
+            self.logger.warning("No compatible files found in SharePoint folder %s", folder_path)
             return {'success': True, 'processed': 0, 'errors': 0, 'files': []}
         
         # Default mapping uses filename patterns
         if provider_mapping is None:
             provider_mapping = {}
+        match_provider = compile_provider_mapping(provider_mapping)
         
-        # Create a temp directory for files
-        import tempfile
-        temp_dir = tempfile.mkdtemp()
-        
-        processed_count = 0
-        error_count = 0
-        results = []
-        
+        tasks = []
         for file_info in files:
             file_name = file_info.get('Name', '')
             content = file_info.get('Content')
             
             if not content:
-                self.logger.warning(f"Skipping file {file_name} - no content")
+                self.logger.warning("Skipping file %s - no content", file_name)
                 continue
             
             # Determine provider for this file
-            provider_name = None
-            for pattern, provider in provider_mapping.items():
-                if pattern in file_name:
-                    provider_name = provider
-                    break
+            provider_name = match_provider(file_name)
             
             # Skip if no provider mapping
             if not provider_name:
-                self.logger.warning(f"Skipping file {file_name} - no provider mapping found")
+                self.logger.warning("Skipping file %s - no provider mapping found", file_name)
                 continue
             
-            # Save file temporarily
-            temp_file_path = os.path.join(temp_dir, file_name)
-            with open(temp_file_path, 'wb') as f:
-                f.write(content)
-            
-            # Process the file
-            result = self.process_file(temp_file_path, provider_name)
-            results.append(result)
-            
-            # Clean up temp file
-            try:
-                os.remove(temp_file_path)
-            except:
-                pass
-            
-            if result.get('success', False):
-                processed_count += 1
-            else:
-                error_count += 1
+            # The downloaded content is parsed in memory; the SharePoint path identifies the file
+            sharepoint_path = f"{folder_path.rstrip('/')}/{file_name}"
+            tasks.append((len(tasks), sharepoint_path, provider_name, self.config_path, content))
         
-        # Clean up temp dir
-        try:
-            os.rmdir(temp_dir)
-        except:
-            pass
+        indexed_results = self._run_tasks(tasks, processes, progress_callback, pool)
+        processed_count, error_count, results = self._collect_results(tasks, indexed_results)
         
         return {
             'success': True,
@@ -367,44 +831,136 @@ class FinancialHarmonizer:
             'results': results
         }
     
-    def export_results(self, output_path: str, format: str = 'csv') -> Dict[str, Any]:
+    def export_results(self, output_path: str, format: str = 'csv', engine: str = 'default') -> Dict[str, Any]:
         """
         Export harmonized data to a file.
         
         Args:
             output_path: Path to save the output file
             format: Output format ('csv' or 'excel')
+            engine: Writer to use: 'default' for pandas, 'fast-excel' for the columnar
+                xlsxwriter path (Excel) or 'arrow' for pyarrow's CSV writer (CSV)
             
         Returns:
             Export status
         """
-        if self.master_data is None or self.master_data.empty:
+        # CSV export works on the per-file frames, so pending ones are not merged first
+        if not self.has_data:
             return {'success': False, 'error': 'No data to export'}
+        frames = self._master_frames()
         
         try:
             if format.lower() == 'csv':
-                self.master_data.to_csv(output_path, index=False)
+                self._write_csv(frames, output_path, engine)
             elif format.lower() == 'excel':
-                self.master_data.to_excel(output_path, index=False)
+                if engine == 'fast-excel':
+                    self._write_excel_columns(self.master_data, output_path)
+                else:
+                    self.master_data.to_excel(output_path, index=False)
             else:
                 return {'success': False, 'error': f'Unsupported format: {format}'}
             
             # Export logs to a separate file
             log_path = output_path + '.log.json'
-            with open(log_path, 'w') as f:
-                json.dump(self.master_log, f, indent=2)
+            if orjson is not None:
+                with open(log_path, 'wb') as f:
+                    f.write(orjson.dumps(self.master_log, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+            else:
+                with open(log_path, 'w') as f:
+                    json.dump(self.master_log, f, indent=2)
                 
             return {
                 'success': True,
                 'path': output_path,
                 'log_path': log_path,
-                'rows': len(self.master_data),
-                'columns': len(self.master_data.columns)
+                'rows': sum(len(frame) for frame in frames),
+                'columns': len(dict.fromkeys(column for frame in frames for column in frame.columns))
             }
             
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
+    def _write_csv(self, frames: List[pd.DataFrame], output_path: str, engine: str = 'default') -> None:
+        """
+        Write frames one after another to a single CSV.
+        
+        The default pandas writer formats values exactly like writing the
+        concatenated master data. Frames sharing columns and dtypes are
+        appended one by one, so the combined frame is only built when their
+        schemas differ. With engine='arrow' pyarrow's native writer is used
+        instead: each frame is converted on its own and the tables are joined
+        with concat_tables, which only references their buffers. Its output
+        differs from pandas (quoted strings, lower-case booleans, timestamps
+        with microseconds, integers without '.0'). It falls back to pandas when
+        pyarrow is missing or cannot convert or join the frames (e.g. object
+        columns holding mixed types, or a column whose type differs between files).
+        
+        Args:
+            frames: DataFrames to write, in order
+            output_path: Path to save the CSV file
+            engine: 'default' for pandas or 'arrow' for pyarrow's CSV writer
+        """
+        if engine == 'arrow' and PYARROW_AVAILABLE:
+            try:
+                tables = [pa.Table.from_pandas(frame, preserve_index=False, nthreads=os.cpu_count()) for frame in frames]
+                table = pa.concat_tables(tables, **_ARROW_PROMOTE) if len(tables) > 1 else tables[0]
+                pa_csv.write_csv(table, output_path, write_options=pa_csv.WriteOptions(include_header=True))
+                return
+            except (pa.ArrowException, TypeError, ValueError) as e:
+                self.logger.warning("pyarrow CSV export failed, falling back to pandas: %s", e)
+        
+        first = frames[0]
+        same_schema = all(
+            frame.columns.equals(first.columns) and all(
+                dtype == first_dtype or (isinstance(dtype, pd.CategoricalDtype) and isinstance(first_dtype, pd.CategoricalDtype))
+                for dtype, first_dtype in zip(frame.dtypes, first.dtypes)
+            )
+            for frame in frames[1:]
+        )
+        if not same_schema:
+            _fast_concat(frames).to_csv(output_path, index=False)
+            return
+        
+        # Concatenating would not change any dtype, so each frame is written as it is
+        first.to_csv(output_path, index=False)
+        for frame in frames[1:]:
+            frame.to_csv(output_path, index=False, mode='a', header=False)
+    
+    def _write_excel_columns(self, df: pd.DataFrame, output_path: str) -> None:
+        """
+        Write a DataFrame to Excel one column at a time with xlsxwriter.
+        
+        Each column is converted to Python values once and written with a
+        single write_column call, instead of pandas' per-cell dispatch.
+        Falls back to pandas when xlsxwriter is not installed.
+        
+        Args:
+            df: DataFrame to write
+            output_path: Path to save the Excel file
+        """
+        try:
+            import xlsxwriter
+        except ImportError:
+            self.logger.warning("xlsxwriter not installed, falling back to pandas Excel export")
+            df.to_excel(output_path, index=False)
+            return
+        
+        workbook = xlsxwriter.Workbook(output_path)
+        try:
+            worksheet = workbook.add_worksheet()
+            header_format = workbook.add_format({'bold': True})
+            date_format = workbook.add_format({'num_format': 'yyyy-mm-dd hh:mm:ss'})
+            
+            for col_idx, col_name in enumerate(df.columns):
+                series = df.iloc[:, col_idx]
+                cell_format = date_format if pd.api.types.is_datetime64_any_dtype(series) else None
+                values = series.astype(object).where(series.notna(), None).tolist()
+                
+                worksheet.write(0, col_idx, str(col_name), header_format)
+                worksheet.write_column(1, col_idx, values, cell_format)
+        finally:
+            workbook.close()
+    
     def get_summary(self) -> Dict[str, Any]:
         """
         Get a summary of all processing operations.
@@ -11,8 +11,72 @@ from pathlib import Path
 import platform
 import time
 
+# psutil is optional; it lists processes in-process instead of spawning tasklist/pgrep
+PSUTIL_AVAILABLE = False
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    pass
+
+def _streamlit_process_found(name, cmdline):
+    """Check a process name/command line the way tasklist (Windows) or pgrep -f (elsewhere) would."""
+    if platform.system() == "Windows":
+        return (name or "").lower() == "streamlit.exe"
+    return "streamlit" in " ".join(cmdline or [])
+
+def is_process_running(pid):
+    """Check whether a process with the given PID is alive, without starting a subprocess."""
+    if PSUTIL_AVAILABLE:
+        return psutil.pid_exists(pid)
+    
+    if platform.system() == "Windows":
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        PROCESS_QUERY_INFORMATION = 0x0400
+        handle = kernel32.OpenProcess(PROCESS_QUERY_INFORMATION, False, pid)
+        if handle:
+            kernel32.CloseHandle(handle)
+            return True
+        return False
+    
+    try:
+        os.kill(pid, 0)
+    except PermissionError:
+        # The process exists but belongs to another user
+        return True
+    except OSError:
+        return False
+    return True
+
 def check_running_instance():
     """Check if another instance is already running."""
+    own_pid = os.getpid()
+    
+    # Scan the process table without starting a subprocess when possible
+    if PSUTIL_AVAILABLE:
+        try:
+            return any(
+                proc.pid != own_pid and _streamlit_process_found(proc.info['name'], proc.info['cmdline'])
+                for proc in psutil.process_iter(['name', 'cmdline'])
+            )
+        except Exception:
+            return False
+    
+    if platform.system() == "Linux" and os.path.isdir("/proc"):
+        with os.scandir("/proc") as entries:
+            for entry in entries:
+                if not entry.name.isdigit() or int(entry.name) == own_pid:
+                    continue
+                try:
+                    with open(os.path.join(entry.path, "cmdline"), "rb") as f:
+                        cmdline = f.read().decode(errors="replace").split("\0")
+                except OSError:
+                    continue
+                if _streamlit_process_found(None, cmdline):
+                    return True
+        return False
+    
     # Different commands based on OS
     if platform.system() == "Windows":
         try:
@@ -24,7 +88,7 @@ def check_running_instance():
             return False
     else:
         try:
-            # For MacOS/Linux
+            # For MacOS
             result = subprocess.run("pgrep -f streamlit", 
                                    shell=True, capture_output=True, text=True)
             return bool(result.stdout.strip())
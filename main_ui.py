@@ -7,6 +7,9 @@ import sys
 import subprocess
 from pathlib import Path
 import importlib
+import importlib.util
+import json
+import time
 import traceback
 import uuid
 
@@ -15,6 +18,8 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
+from launcher import is_process_running
+
 # Check if we're running in streamlit
 IN_STREAMLIT = os.environ.get('STREAMLIT_RUNTIME_LOOP') == 'true'
 
@@ -22,6 +27,10 @@ IN_STREAMLIT = os.environ.get('STREAMLIT_RUNTIME_LOOP') == 'true'
 LOCK_FILE = Path(current_dir) / ".harmonizer.lock"
 INSTANCE_ID = str(uuid.uuid4())
 
+# Successful streamlit import checks are remembered here for a day
+STREAMLIT_CHECK_CACHE = Path.home() / ".harmonizer_cache.json"
+STREAMLIT_CHECK_MAX_AGE = 24 * 60 * 60
+
 def is_already_running():
     """Check if another instance is running by checking the lock file."""
     if LOCK_FILE.exists():
@@ -30,24 +39,8 @@ def is_already_running():
             with open(LOCK_FILE, "r") as f:
                 pid = f.read().strip()
             
-            # Try to check if the process is running
-            if pid:
-                # On Windows
-                if sys.platform.startswith("win"):
-                    import ctypes
-                    kernel32 = ctypes.windll.kernel32
-                    PROCESS_QUERY_INFORMATION = 0x0400
-                    handle = kernel32.OpenProcess(PROCESS_QUERY_INFORMATION, False, int(pid))
-                    if handle:
-                        kernel32.CloseHandle(handle)
-                        return True
-                # On Unix-like systems
-                else:
-                    try:
-                        os.kill(int(pid), 0)
-                        return True
-                    except OSError:
-                        pass
+            if pid and is_process_running(int(pid)):
+                return True
         except:
             pass
             
@@ -75,8 +68,34 @@ def remove_lock_file():
     except:
         print("Warning: Could not remove lock file")
 
-def check_streamlit_importable():
-    """Check if streamlit can be imported without issues."""
+def _streamlit_check_key():
+    """Identify the interpreter and streamlit installation a cached check applies to."""
+    try:
+        # find_spec locates the package without importing it
+        spec = importlib.util.find_spec("streamlit")
+        if spec is None or not spec.origin:
+            return None
+        return [sys.executable, os.path.getmtime(sys.executable), spec.origin, os.path.getmtime(spec.origin)]
+    except (ImportError, ValueError, OSError):
+        return None
+
+def check_streamlit_importable(use_cache=True):
+    """
+    Check if streamlit can be imported without issues.
+    
+    A successful check is cached in STREAMLIT_CHECK_CACHE and reused for a day
+    while the interpreter and the installed streamlit package are unchanged,
+    skipping the slow import subprocess. Failures are never cached.
+    """
+    key = _streamlit_check_key() if use_cache else None
+    if key is not None:
+        try:
+            cached = json.loads(STREAMLIT_CHECK_CACHE.read_text())
+            if cached.get("key") == key and time.time() - cached.get("checked_at", 0) < STREAMLIT_CHECK_MAX_AGE:
+                return True
+        except (OSError, ValueError, AttributeError):
+            pass
+    
     try:
         # Try in subprocess to avoid affecting current process
         result = subprocess.run(
@@ -84,10 +103,17 @@ def check_streamlit_importable():
             capture_output=True,
             text=True
         )
-        return "Streamlit OK" in result.stdout
+        streamlit_ok = "Streamlit OK" in result.stdout
     except Exception as e:
         print(f"Error checking Streamlit: {e}")
         return False
+    
+    if streamlit_ok and key is not None:
+        try:
+            STREAMLIT_CHECK_CACHE.write_text(json.dumps({"key": key, "checked_at": time.time()}))
+        except OSError:
+            pass
+    return streamlit_ok
 
 def fix_streamlit_installation():
     """Attempt to fix Streamlit installation."""
@@ -118,7 +144,7 @@ def fix_streamlit_installation():
             sys.executable, "-m", "pip", "install", "streamlit==1.22.0"
         ])
         
-        return check_streamlit_importable()
+        return check_streamlit_importable(use_cache=False)
     except Exception as e:
         print(f"Failed to fix Streamlit: {e}")
         traceback.print_exc()
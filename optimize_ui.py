@@ -12,6 +12,23 @@ import time
 import argparse
 import logging
 import re
+import functools
+
+# libcst is optional; it rewrites Streamlit sources from a parsed syntax tree
+# instead of regular expressions
+LIBCST_AVAILABLE = False
+try:
+    import libcst as cst
+    import libcst.matchers as m
+    LIBCST_AVAILABLE = True
+except ImportError:
+    pass
+
+# orjson is optional; it serializes the analysis results faster than the stdlib encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Set up logging
 logging.basicConfig(
@@ -24,30 +41,73 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Patterns used for every scanned or rewritten file (scanned sources are raw bytes)
+_IMPORT_RE = re.compile(rb'^(?:from\s+(?P<from>[\w.]+)\s+import\s+[^\r\n]*|import\s+[^\r\n]*)(?=\r?$)', re.MULTILINE)
+_CACHE_INSERT_RE = re.compile(r"(def\s+\w+\([^)]*\):)(\s+)([^\n]*pd\.)")
+_FUNCTION_BODY_RE = re.compile(r"def\s+\w+\([^)]*\):\s+")
+_SESSION_STATE_INSERT_RE = re.compile(r"(def\s+\w+\([^)]*\):)(\s+)(?!if\s+\"[\w_]+\"\s+not\s+in\s+st\.session_state)")
+_SESSION_STATE_ACCESS_RE = re.compile(r"st\.session_state\.(\w+)")
+
+# Directories never searched for UI sources
+_SKIP_DIRS = {'__pycache__', '.git', '.venv', 'node_modules'}
+
+@functools.lru_cache(maxsize=1)
 def get_project_root():
     """Get the project root directory."""
     return Path(__file__).parent
 
-def scan_imports(file_path):
+def _iter_py(root):
+    """Yield all .py files below root, walking with os.scandir and skipping cache/VCS directories."""
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith('.py') and entry.is_file():
+                        yield Path(entry.path)
+        except OSError:
+            continue
+
+def read_sources(file_paths):
+    """Read each file once as bytes, returning a path -> content map (files that fail to read are left out)."""
+    contents = {}
+    for file_path in file_paths:
+        if file_path in contents:
+            continue
+        try:
+            with open(file_path, 'rb') as f:
+                contents[file_path] = f.read()
+        except Exception:
+            # The analyzers open the file themselves and report the error
+            pass
+    return contents
+
+def _get_content(file_path, contents):
+    """Return a file's raw bytes from the contents map, reading the file if it is missing."""
+    if contents is not None and file_path in contents:
+        return contents[file_path]
+    with open(file_path, 'rb') as f:
+        return f.read()
+
+def scan_imports(file_path, contents=None):
     """Scan a file for import statements and analyze them."""
     try:
-        with open(file_path, 'r') as f:
-            content = f.read()
+        content = _get_content(file_path, contents)
             
-        # Find all import statements
+        # Find all import statements and flag "from" imports of the file's own package
+        # as potential circular imports; only the matched lines are decoded
         import_lines = []
-        import_pattern = re.compile(r'^(?:from\s+[\w.]+\s+import\s+.*|import\s+.*)$', re.MULTILINE)
-        for match in import_pattern.finditer(content):
-            import_lines.append(match.group(0))
-        
-        # Analyze circular imports
         circular_imports = []
-        parent_dir = os.path.dirname(file_path)
-        for imp in import_lines:
-            if 'from' in imp:
-                module = imp.split('from')[1].strip().split('import')[0].strip()
-                if parent_dir.split(os.sep)[-1] in module:
-                    circular_imports.append(imp)
+        parent_name = os.path.basename(os.path.dirname(file_path)).encode('utf-8')
+        for match in _IMPORT_RE.finditer(content):
+            imp = match.group(0).decode('utf-8', errors='replace')
+            import_lines.append(imp)
+            module = match.group('from')
+            if module and parent_name in module:
+                circular_imports.append(imp)
             
         return {
             "file": str(file_path),
@@ -65,27 +125,41 @@ def scan_imports(file_path):
             "error": str(e)
         }
 
-def analyze_streamlit_ui(file_paths):
+def analyze_streamlit_ui(file_paths, contents=None):
     """Analyze Streamlit UI files for specific performance issues."""
     results = []
     
     for file_path in file_paths:
         try:
-            with open(file_path, 'r') as f:
-                content = f.read()
+            content = _get_content(file_path, contents)
+            
+            # Files without any Streamlit calls have nothing else to count
+            if b"st." not in content:
+                results.append({
+                    "file": str(file_path),
+                    "session_state_count": 0,
+                    "rerun_count": 0,
+                    "uses_caching": False,
+                    "issues": {
+                        "redundant_session_state": False,
+                        "excessive_reruns": False,
+                        "missing_caching": b"pd." in content
+                    }
+                })
+                continue
             
             # Check for session state issues
-            session_state_count = content.count("st.session_state")
+            session_state_count = content.count(b"st.session_state")
             redundant_session_state = False
             if session_state_count > 10:  # Arbitrary threshold for excessive use
                 redundant_session_state = True
             
             # Check for rendering performance issues
-            rerun_count = content.count("st.experimental_rerun")
+            rerun_count = content.count(b"st.experimental_rerun")
             excessive_reruns = rerun_count > 3  # Arbitrary threshold
             
-            # Check for data caching
-            uses_caching = "@st.cache_data" in content or "@st.cache" in content
+            # Check for data caching ("@st.cache" also covers @st.cache_data/@st.cache_resource)
+            uses_caching = b"@st.cache" in content
             
             results.append({
                 "file": str(file_path),
@@ -95,7 +169,7 @@ def analyze_streamlit_ui(file_paths):
                 "issues": {
                     "redundant_session_state": redundant_session_state,
                     "excessive_reruns": excessive_reruns,
-                    "missing_caching": not uses_caching and "pd." in content  # Data operations without caching
+                    "missing_caching": not uses_caching and b"pd." in content  # Data operations without caching
                 }
             })
         except Exception as e:
@@ -107,23 +181,22 @@ def analyze_streamlit_ui(file_paths):
     
     return results
 
-def analyze_tkinter_ui(file_paths):
+def analyze_tkinter_ui(file_paths, contents=None):
     """Analyze Tkinter UI files for specific performance issues."""
     results = []
     
     for file_path in file_paths:
         try:
-            with open(file_path, 'r') as f:
-                content = f.read()
+            content = _get_content(file_path, contents)
             
             # Check for memory leaks (widgets not properly destroyed)
-            proper_cleanup = "destroy" in content and "winfo_children" in content
+            proper_cleanup = b"destroy" in content and b"winfo_children" in content
             
             # Check for event handling issues
-            event_handling_issues = "bind" in content and "unbind" not in content
+            event_handling_issues = b"bind" in content and b"unbind" not in content
             
             # Check for resource management
-            resource_management_issues = "open(" in content and "close" not in content
+            resource_management_issues = b"open(" in content and b"close" not in content
             
             results.append({
                 "file": str(file_path),
@@ -163,8 +236,8 @@ def create_optimization_recommendations(analysis_results):
     tkinter_issues = [result for result in analysis_results.get("tkinter", []) 
                       if any(result.get("issues", {}).values())]
     
-    # Build recommendations document
-    content = """# UI Optimization Recommendations
+    # Build recommendations document from parts joined once at the end
+    parts = ["""# UI Optimization Recommendations
 
 ## Overview
 
@@ -190,50 +263,50 @@ This document provides recommendations for optimizing the Financial Harmonizer U
         circular_imports=circular_imports,
         streamlit_issues=len(streamlit_issues),
         tkinter_issues=len(tkinter_issues)
-    )
+    )]
     
     # Add Streamlit recommendations
     if streamlit_issues:
         for issue in streamlit_issues:
             file = Path(issue["file"]).name
-            content += f"#### {file}\n\n"
+            parts.append(f"#### {file}\n\n")
             
             if issue.get("issues", {}).get("redundant_session_state"):
-                content += f"- **Reduce Session State Usage**: The file uses session state {issue.get('session_state_count', 0)} times, which may impact performance. Consider consolidating related state variables.\n"
+                parts.append(f"- **Reduce Session State Usage**: The file uses session state {issue.get('session_state_count', 0)} times, which may impact performance. Consider consolidating related state variables.\n")
             
             if issue.get("issues", {}).get("excessive_reruns"):
-                content += f"- **Minimize Page Reruns**: The file uses `st.experimental_rerun()` {issue.get('rerun_count', 0)} times. Consider using callbacks and other patterns to reduce full page reruns.\n"
+                parts.append(f"- **Minimize Page Reruns**: The file uses `st.experimental_rerun()` {issue.get('rerun_count', 0)} times. Consider using callbacks and other patterns to reduce full page reruns.\n")
             
             if issue.get("issues", {}).get("missing_caching"):
-                content += "- **Implement Caching**: Add `@st.cache_data` decorators to data loading and processing functions to improve performance.\n"
+                parts.append("- **Implement Caching**: Add `@st.cache_data` decorators to data loading and processing functions to improve performance.\n")
             
-            content += "\n"
+            parts.append("\n")
     else:
-        content += "No major Streamlit optimization issues detected.\n\n"
+        parts.append("No major Streamlit optimization issues detected.\n\n")
     
     # Add Tkinter recommendations
-    content += "\n### 3. Tkinter-Specific Optimizations\n\n"
+    parts.append("\n### 3. Tkinter-Specific Optimizations\n\n")
     
     if tkinter_issues:
         for issue in tkinter_issues:
             file = Path(issue["file"]).name
-            content += f"#### {file}\n\n"
+            parts.append(f"#### {file}\n\n")
             
             if issue.get("issues", {}).get("missing_widget_cleanup"):
-                content += "- **Improve Widget Cleanup**: Ensure all widgets are properly destroyed when no longer needed to prevent memory leaks.\n"
+                parts.append("- **Improve Widget Cleanup**: Ensure all widgets are properly destroyed when no longer needed to prevent memory leaks.\n")
             
             if issue.get("issues", {}).get("event_handling_issues"):
-                content += "- **Fix Event Handling**: Make sure event bindings are properly managed with corresponding unbinds when appropriate.\n"
+                parts.append("- **Fix Event Handling**: Make sure event bindings are properly managed with corresponding unbinds when appropriate.\n")
             
             if issue.get("issues", {}).get("resource_management_issues"):
-                content += "- **Resource Management**: Ensure all opened resources (files, connections) are properly closed.\n"
+                parts.append("- **Resource Management**: Ensure all opened resources (files, connections) are properly closed.\n")
             
-            content += "\n"
+            parts.append("\n")
     else:
-        content += "No major Tkinter optimization issues detected.\n\n"
+        parts.append("No major Tkinter optimization issues detected.\n\n")
     
     # Add general recommendations
-    content += """
+    parts.append("""
 ### 4. General Code Quality Improvements
 
 - **Reduce Import Dependencies**: Minimize imports between UI components to prevent circular dependencies
@@ -251,14 +324,118 @@ This document provides recommendations for optimizing the Financial Harmonizer U
 - Create automated tests for UI components
 - Measure rendering performance before and after optimizations
 - Test both UIs (Streamlit and Tkinter) with the same operations
-"""
+""")
     
     with open(recommendations_path, 'w') as f:
-        f.write(content)
+        f.write("".join(parts))
     
     logger.info(f"Created optimization recommendations at {recommendations_path}")
     return str(recommendations_path)
 
+CHANGE_CACHING = "Added @st.cache_data to data processing functions"
+CHANGE_RERUN = "Replaced st.experimental_rerun with st.rerun"
+CHANGE_SESSION_STATE = "Optimized session state access pattern"
+
+if LIBCST_AVAILABLE:
+    _DOCSTRING = m.SimpleStatementLine(body=[m.Expr(value=m.SimpleString() | m.ConcatenatedString())])
+    
+    class _StreamlitOptimizer(cst.CSTTransformer):
+        """Apply the Streamlit optimizations to a parsed module in one traversal."""
+        
+        def __init__(self, add_caching):
+            super().__init__()
+            self.add_caching = add_caching
+            self.changes = set()
+            # One flag per enclosing function: whether it now reads session_state
+            self._session_state_used = []
+        
+        def visit_FunctionDef(self, node):
+            self._session_state_used.append(False)
+        
+        def leave_Attribute(self, original_node, updated_node):
+            # Replace deprecated functions
+            if m.matches(updated_node, m.Attribute(value=m.Name("st"), attr=m.Name("experimental_rerun"))):
+                self.changes.add(CHANGE_RERUN)
+                return updated_node.with_changes(attr=cst.Name("rerun"))
+            
+            # Inside functions, st.session_state.<name> reads the local alias
+            if self._session_state_used and m.matches(
+                    updated_node.value, m.Attribute(value=m.Name("st"), attr=m.Name("session_state"))):
+                self._session_state_used[-1] = True
+                return updated_node.with_changes(value=cst.Name("session_state"))
+            return updated_node
+        
+        def leave_FunctionDef(self, original_node, updated_node):
+            if self._session_state_used.pop():
+                body = updated_node.body
+                if not isinstance(body, cst.IndentedBlock):
+                    # One-line function: move its statements into a block first
+                    body = cst.IndentedBlock(body=[cst.SimpleStatementLine(body=body.body)])
+                statements = list(body.body)
+                # Keep a docstring as the first statement
+                index = 1 if statements and m.matches(statements[0], _DOCSTRING) else 0
+                statements.insert(index, cst.parse_statement("session_state = st.session_state\n"))
+                updated_node = updated_node.with_changes(body=body.with_changes(body=statements))
+                self.changes.add(CHANGE_SESSION_STATE)
+            
+            # Cache functions whose first statement (after any docstring) works with pandas
+            original_body = list(original_node.body.body)
+            if original_body and m.matches(original_body[0], _DOCSTRING):
+                original_body = original_body[1:]
+            if self.add_caching and original_body and m.findall(original_body[0], m.Attribute(value=m.Name("pd"))):
+                decorator = cst.Decorator(decorator=cst.parse_expression("st.cache_data"))
+                updated_node = updated_node.with_changes(decorators=[decorator, *updated_node.decorators])
+                self.changes.add(CHANGE_CACHING)
+            return updated_node
+
+def _optimize_streamlit_source_cst(content):
+    """
+    Optimize Streamlit source code using libcst.
+    
+    Only functions that access st.session_state attributes get the local
+    session_state alias, and module-level code is left untouched.
+    
+    Returns:
+        Tuple of (new content, list of changes)
+    """
+    add_caching = "pd." in content and "@st.cache" not in content
+    optimizer = _StreamlitOptimizer(add_caching)
+    new_content = cst.parse_module(content).visit(optimizer).code
+    changes = [change for change in (CHANGE_CACHING, CHANGE_RERUN, CHANGE_SESSION_STATE) if change in optimizer.changes]
+    return new_content, changes
+
+def _optimize_streamlit_source_regex(content):
+    """
+    Optimize Streamlit source code with regular expressions.
+    
+    Returns:
+        Tuple of (new content, list of changes)
+    """
+    changes = []
+    
+    # Add caching to data operations
+    if "pd." in content and "@st.cache" not in content:
+        if _CACHE_INSERT_RE.search(content):
+            content = _CACHE_INSERT_RE.sub(r"@st.cache_data\n\1\2\3", content)
+            changes.append(CHANGE_CACHING)
+    
+    # Replace deprecated functions
+    if "st.experimental_rerun" in content:
+        content = content.replace("st.experimental_rerun", "st.rerun")
+        changes.append(CHANGE_RERUN)
+    
+    # Optimize session state access
+    if "st.session_state" in content:
+        # Extract session state variables into a single dictionary at the start of functions
+        if _FUNCTION_BODY_RE.search(content):
+            replacement = r"\1\2# Extract session state variables\2session_state = st.session_state\2"
+            content = _SESSION_STATE_INSERT_RE.sub(replacement, content)
+            # Replace individual st.session_state accesses with session_state
+            content = _SESSION_STATE_ACCESS_RE.sub(r"session_state.\1", content)
+            changes.append(CHANGE_SESSION_STATE)
+    
+    return content, changes
+
 def optimize_streamlit_files(files, apply_changes=False):
     """Optimize Streamlit files."""
     results = []
@@ -269,30 +446,15 @@ def optimize_streamlit_files(files, apply_changes=False):
                 content = f.read()
             
             original_content = content
-            changes = []
-            
-            # Add caching to data operations
-            if "pd." in content and "@st.cache" not in content:
-                pattern = r"(def\s+\w+\([^)]*\):)(\s+)([^\n]*pd\.)"
-                if re.search(pattern, content):
-                    content = re.sub(pattern, r"@st.cache_data\n\1\2\3", content)
-                    changes.append("Added @st.cache_data to data processing functions")
-            
-            # Replace deprecated functions
-            if "st.experimental_rerun" in content:
-                content = content.replace("st.experimental_rerun", "st.rerun")
-                changes.append("Replaced st.experimental_rerun with st.rerun")
             
-            # Optimize session state access
-            if "st.session_state" in content:
-                # Extract session state variables into a single dictionary at the start of functions
-                if re.search(r"def\s+\w+\([^)]*\):\s+", content):
-                    pattern = r"(def\s+\w+\([^)]*\):)(\s+)(?!if\s+\"[\w_]+\"\s+not\s+in\s+st\.session_state)"
-                    replacement = r"\1\2# Extract session state variables\2session_state = st.session_state\2"
-                    content = re.sub(pattern, replacement, content)
-                    # Replace individual st.session_state accesses with session_state
-                    content = re.sub(r"st\.session_state\.(\w+)", r"session_state.\1", content)
-                    changes.append("Optimized session state access pattern")
+            # Parse once with libcst when available; sources it cannot parse use the regex rewrites
+            if LIBCST_AVAILABLE:
+                try:
+                    content, changes = _optimize_streamlit_source_cst(content)
+                except cst.ParserSyntaxError:
+                    content, changes = _optimize_streamlit_source_regex(content)
+            else:
+                content, changes = _optimize_streamlit_source_regex(content)
             
             # Apply changes if requested
             if apply_changes and changes and content != original_content:
@@ -342,12 +504,12 @@ def analyze_ui():
     # Streamlit UI files
     streamlit_ui_dir = project_root / "ui"
     if streamlit_ui_dir.exists():
-        streamlit_ui_files = list(streamlit_ui_dir.glob("**/*.py"))
+        streamlit_ui_files = list(_iter_py(streamlit_ui_dir))
     
     # Tkinter UI files
     tkinter_ui_dir = project_root / "ui_tkinter"
     if tkinter_ui_dir.exists():
-        tkinter_ui_files = list(tkinter_ui_dir.glob("**/*.py"))
+        tkinter_ui_files = list(_iter_py(tkinter_ui_dir))
     
     # Additional UI-related files
     for file in project_root.glob("*.py"):
@@ -358,13 +520,16 @@ def analyze_ui():
     logger.info(f"Found {len(tkinter_ui_files)} Tkinter UI files")
     logger.info(f"Found {len(shared_ui_files)} shared UI files")
     
-    # Analyze imports
+    # Read every file once; all analyzers work from the same contents
     all_ui_files = streamlit_ui_files + tkinter_ui_files + shared_ui_files
-    import_analysis = [scan_imports(file) for file in all_ui_files]
+    contents = read_sources(all_ui_files)
+    
+    # Analyze imports
+    import_analysis = [scan_imports(file, contents) for file in all_ui_files]
     
     # Analyze specific UI frameworks
-    streamlit_analysis = analyze_streamlit_ui(streamlit_ui_files + [f for f in shared_ui_files if "streamlit" in f.name.lower()])
-    tkinter_analysis = analyze_tkinter_ui(tkinter_ui_files + [f for f in shared_ui_files if "tkinter" in f.name.lower()])
+    streamlit_analysis = analyze_streamlit_ui(streamlit_ui_files + [f for f in shared_ui_files if "streamlit" in f.name.lower()], contents)
+    tkinter_analysis = analyze_tkinter_ui(tkinter_ui_files + [f for f in shared_ui_files if "tkinter" in f.name.lower()], contents)
     
     # Compile results
     analysis_results = {
@@ -380,10 +545,14 @@ def analyze_ui():
         }
     }
     
-    # Save analysis results
+    # Save analysis results as compact JSON (the file is read by tools, not people)
     results_path = project_root / "ui_analysis_results.json"
-    with open(results_path, 'w') as f:
-        json.dump(analysis_results, f, indent=2, default=str)
+    if orjson is not None:
+        with open(results_path, 'wb') as f:
+            f.write(orjson.dumps(analysis_results, default=str))
+    else:
+        with open(results_path, 'w', encoding='utf-8') as f:
+            json.dump(analysis_results, f, separators=(',', ':'), default=str)
     
     logger.info(f"Saved analysis results to {results_path}")
     
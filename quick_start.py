@@ -19,14 +19,23 @@ def install_core_requirements():
         "python-dateutil>=2.8.2",
     ]
     
-    # Install core packages
-    for package in core_packages:
-        print(f"Installing {package.split('>=')[0]}...")
-        try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", package])
+    pip_install = [sys.executable, "-m", "pip", "install", "--disable-pip-version-check", "--no-input"]
+    
+    # Install core packages with a single pip run so they are resolved together
+    print(f"Installing {', '.join(package.split('>=')[0] for package in core_packages)}...")
+    try:
+        subprocess.check_call(pip_install + core_packages)
+        for package in core_packages:
             print(f"✓ Successfully installed {package}")
-        except subprocess.CalledProcessError:
-            print(f"✗ Failed to install {package}")
+    except subprocess.CalledProcessError:
+        # Retry one package at a time to find out which one failed
+        for package in core_packages:
+            print(f"Installing {package.split('>=')[0]}...")
+            try:
+                subprocess.check_call(pip_install + [package])
+                print(f"✓ Successfully installed {package}")
+            except subprocess.CalledProcessError:
+                print(f"✗ Failed to install {package}")
     
     print("\nCore packages installed successfully!")
 
@@ -65,13 +74,14 @@ def run_test():
         sys.path.append(str(Path(__file__).parent))
     
     try:
-        from harmonizer_app import FinancialHarmonizer
-        
         # Create test file
         test_file = create_test_file()
         if not test_file:
             return False
         
+        # Only pay for importing the harmonizer (and its dependencies) once there is a file to process
+        from harmonizer_app import FinancialHarmonizer
+        
         # Make sure output directory exists
         output_dir = Path(__file__).parent / "test_files2"
         output_dir.mkdir(exist_ok=True)
@@ -5,11 +5,47 @@ import os
 import subprocess
 from pathlib import Path
 
-def run_command(command):
-    """Run a command and return its output."""
+def run_command(command, out_file=None):
+    """
+    Run a command and return its output.
+    
+    With out_file, the output goes straight to that open file instead of
+    being collected in memory, and None is returned.
+    """
+    if out_file is not None:
+        # Flush pending writes so the command's output lands after them
+        out_file.flush()
+        subprocess.run(command, shell=True, stdout=out_file, stderr=subprocess.DEVNULL)
+        return None
     result = subprocess.run(command, shell=True, capture_output=True, text=True)
     return result.stdout
 
+# Directories left out of the structure listing
+SKIP_DIRS = {'.git', '__pycache__', 'node_modules', '.venv'}
+
+def _scandir_recursive(root):
+    """
+    Yield the absolute paths of all files and directories below root.
+    
+    Lists each directory's entries before descending into its subdirectories,
+    in name order, like 'dir /b /s'.
+    """
+    stack = [os.path.abspath(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = sorted((entry for entry in it if entry.name not in SKIP_DIRS), key=lambda entry: entry.name.lower())
+        except OSError:
+            continue
+        
+        subdirs = []
+        for entry in entries:
+            yield entry.path
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+        stack.extend(reversed(subdirs))
+
 def analyze_repo():
     """Analyze the repository status."""
     output_file = 'repo_status.txt'
@@ -17,28 +53,29 @@ def analyze_repo():
     with open(output_file, 'w') as f:
         # Check repo status
         f.write("=== GIT STATUS ===\n")
-        status = run_command('git status')
-        f.write(status + "\n\n")
+        run_command('git status', out_file=f)
+        f.write("\n\n")
         
         # Check staged files
         f.write("=== STAGED FILES ===\n")
-        staged = run_command('git ls-files --stage')
-        f.write(staged + "\n\n")
+        run_command('git ls-files --stage', out_file=f)
+        f.write("\n\n")
         
         # Check directory structure
         f.write("=== DIRECTORY STRUCTURE ===\n")
-        dir_structure = run_command('dir /b /s')
-        f.write(dir_structure + "\n\n")
+        for path in _scandir_recursive('.'):
+            f.write(path + "\n")
+        f.write("\n\n")
         
         # Check ignored files
         f.write("=== IGNORED FILES ===\n")
-        ignored = run_command('git ls-files --ignored --exclude-standard --others')
-        f.write(ignored + "\n\n")
+        run_command('git ls-files --ignored --exclude-standard --others', out_file=f)
+        f.write("\n\n")
         
         # Check untracked files
         f.write("=== UNTRACKED FILES ===\n")
-        untracked = run_command('git ls-files --others --exclude-standard')
-        f.write(untracked + "\n\n")
+        run_command('git ls-files --others --exclude-standard', out_file=f)
+        f.write("\n\n")
     
     print(f"Repository status saved to {output_file}")
 
@@ -194,7 +194,7 @@ class AISchemaGenerator:
             all_data.append([str(col) for col in df.columns])
             
             # Add all data rows
-            for idx, row in df.iterrows():
+            for row in df.itertuples(index=False, name=None):
                 all_data.append([str(val) if pd.notna(val) else "" for val in row])
                 
             # Create a raw DataFrame
@@ -203,8 +203,7 @@ class AISchemaGenerator:
             # Now use header detection on this raw dataframe
             # Look for header candidates - rows with several string values
             header_candidates = []
-            for i in range(min(20, len(raw_df))):
-                row = raw_df.iloc[i]
+            for i, row in enumerate(raw_df.head(20).itertuples(index=False, name=None)):
                 string_count = sum(1 for val in row if isinstance(val, str) and len(str(val).strip()) > 0)
                 digit_count = sum(1 for val in row if isinstance(val, (int, float)) or (
                     isinstance(val, str) and val.replace('.', '', 1).replace('-', '', 1).isdigit()
@@ -0,0 +1,73 @@
+"""
+Regression tests for CSV reading in the FileProcessor
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import core.file_processor as file_processor
+from core.file_processor import FileProcessor
+
+SYNONYMS = [{"Header": "Invoice", "AlternateNames": ["Invoice", "Date", "Amount"]}]
+
+
+@pytest.mark.parametrize("use_polars", [False, True])
+@pytest.mark.parametrize("use_pyarrow", [False, True])
+def test_csv_blank_line_above_header(tmp_path, monkeypatch, use_polars, use_pyarrow):
+    """A blank line above the header must not shift the header row."""
+    if use_polars and not file_processor.POLARS_AVAILABLE:
+        pytest.skip("polars is not installed")
+    if use_pyarrow and not file_processor.PYARROW_AVAILABLE:
+        pytest.skip("pyarrow is not installed")
+    monkeypatch.setattr(file_processor, "POLARS_AVAILABLE", use_polars)
+    monkeypatch.setattr(file_processor, "PYARROW_AVAILABLE", use_pyarrow)
+
+    file_path = tmp_path / "report.csv"
+    file_path.write_text(
+        "Report title,,\n"
+        "\n"
+        "Vendor,ACME,\n"
+        "Invoice,Date,Amount\n"
+        "A1,2023-01-01,1\n"
+        "A2,2023-01-02,2\n"
+    )
+
+    result = FileProcessor().process_file(file_path, SYNONYMS)
+
+    assert list(result["Data"].columns) == ["Invoice", "Date", "Amount"]
+    assert len(result["Data"]) == 2
+    assert result["PreHeaderText"] == "Report title Vendor ACME"
+
+
+@pytest.mark.skipif(not file_processor.PYARROW_AVAILABLE, reason="pyarrow is not installed")
+def test_csv_quoted_line_break_above_header(monkeypatch):
+    """Quoted line breaks above the header must not shift the header row."""
+    monkeypatch.setattr(file_processor, "POLARS_AVAILABLE", False)
+    content = (
+        b'"Report\ntitle",,\n'
+        b"Invoice,Date,Amount\n"
+        b"A1,2023-01-01,1\n"
+    )
+
+    result = FileProcessor().process_file("report.csv", SYNONYMS, content=content)
+
+    assert list(result["Data"].columns) == ["Invoice", "Date", "Amount"]
+    assert len(result["Data"]) == 1
+
+
+@pytest.mark.skipif(not file_processor.POLARS_AVAILABLE, reason="polars is not installed")
+def test_csv_polars_type_change_after_inference_window(tmp_path):
+    """Values that change type late in a column must not make the polars read fail."""
+    rows = [f"INV{i},2023-01-01,{i}" for i in range(300)]
+    rows += ["INV300,2023-01-01,N/A", "INV301,2023-01-01,pending"]
+    file_path = tmp_path / "late_types.csv"
+    file_path.write_text("Invoice,Date,Amount\n" + "\n".join(rows) + "\n")
+
+    result = FileProcessor().process_file(file_path, SYNONYMS)
+
+    assert list(result["Data"].columns) == ["Invoice", "Date", "Amount"]
+    assert len(result["Data"]) == 302
@@ -0,0 +1,56 @@
+"""
+Regression tests for exporting harmonized data
+"""
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import harmonizer_app
+from harmonizer_app import FinancialHarmonizer, _constant_column
+
+
+def _frame(amounts, provider_name="ExampleVendor"):
+    frame = pd.DataFrame({
+        "reference": [f"INV{i}" for i in range(len(amounts))],
+        "paid": [True] * len(amounts),
+        "date": pd.to_datetime(["2024-01-01"] * len(amounts)),
+        "amount": amounts,
+    })
+    frame["provider_name"] = _constant_column(provider_name, len(frame))
+    return frame
+
+
+@pytest.mark.parametrize("frames", [
+    pytest.param([_frame([1.0, -4.0]), _frame([3.0], "OtherVendor")], id="same-schema"),
+    pytest.param([_frame([1.0, -4.0]), _frame([3], "OtherVendor")], id="mixed-dtypes"),
+])
+def test_default_csv_export_matches_pandas(tmp_path, frames):
+    """The default CSV export must be formatted like the concatenated master data written by pandas."""
+    harmonizer = FinancialHarmonizer()
+    harmonizer._pending_frames = list(frames)
+    output_path = tmp_path / "out.csv"
+
+    result = harmonizer.export_results(str(output_path))
+
+    assert result["success"]
+    expected = pd.concat(frames, ignore_index=True).to_csv(index=False)
+    assert output_path.read_text() == expected
+    assert "True" in expected and "-4.0" in expected
+
+
+@pytest.mark.skipif(not harmonizer_app.PYARROW_AVAILABLE, reason="pyarrow is not installed")
+def test_arrow_csv_export_is_opt_in(tmp_path):
+    """engine='arrow' writes the same rows with pyarrow's writer."""
+    harmonizer = FinancialHarmonizer()
+    harmonizer._pending_frames = [_frame([1.0, -4.0]), _frame([3.0], "OtherVendor")]
+    output_path = tmp_path / "out.csv"
+
+    result = harmonizer.export_results(str(output_path), engine="arrow")
+
+    assert result["success"]
+    assert len(pd.read_csv(output_path)) == 3
@@ -0,0 +1,177 @@
+"""
+Tests for the SharePoint connector's download paths, without a SharePoint site
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the project root to the path so we can import our modules
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import connectors.sharepoint_connector as sharepoint_connector
+from connectors.sharepoint_connector import SharePointConnector
+
+
+FILES = [
+    {"Name": "a.csv", "ServerRelativeUrl": "/sites/x/Shared/a.csv"},
+    {"Name": "b.csv", "ServerRelativeUrl": "/sites/x/Shared/b.csv"},
+]
+
+
+class FakeFolder:
+    """Folder listing two files whose content is their name."""
+
+    @property
+    def files(self):
+        # get_files fills in the listed dictionaries, so every listing gets fresh ones
+        return [dict(file_info) for file_info in FILES]
+
+    def get_file(self, name):
+        return name.encode()
+
+
+class FakeSite:
+    def Folder(self, folder_path):
+        return FakeFolder()
+
+
+def _connector(monkeypatch):
+    monkeypatch.setattr(sharepoint_connector, "SHAREPLUM_AVAILABLE", True)
+    connector = SharePointConnector("https://example.sharepoint.com/sites/x")
+    connector.site = FakeSite()
+    return connector
+
+
+def test_get_files_inside_running_event_loop(monkeypatch):
+    """Under a running event loop the downloads fall back to threads instead of asyncio.run."""
+    monkeypatch.setattr(sharepoint_connector, "AIOHTTP_AVAILABLE", True)
+    connector = _connector(monkeypatch)
+    connector.authcookie = object()
+    monkeypatch.setattr(connector, "_fetch_batched", lambda files: None)
+
+    async def get_files():
+        return connector.get_files("Shared", ["csv"])
+
+    result = asyncio.run(get_files())
+
+    assert [file_info["Content"] for file_info in result["Files"]] == [b"a.csv", b"b.csv"]
+
+
+def _batch_part(boundary, status_line, body=b""):
+    return (
+        b"--" + boundary + b"\r\n"
+        b"Content-Type: application/http\r\n"
+        b"Content-Transfer-Encoding: binary\r\n"
+        b"\r\n"
+        + status_line + b"\r\n"
+        b"CONTENT-TYPE: application/octet-stream\r\n"
+        b"\r\n"
+        + body + b"\r\n"
+    )
+
+
+BOUNDARY = b"batchresponse_1234"
+
+
+def test_parse_batch_response_mixed_statuses():
+    """200 and 404 parts come back in order, each body without the CRLF before the next boundary."""
+    content = (
+        _batch_part(BOUNDARY, b"HTTP/1.1 200 OK", b"a,b\r\n1,2\r\n")
+        + _batch_part(BOUNDARY, b"HTTP/1.1 404 Not Found", b'{"error": "missing"}')
+        + b"--" + BOUNDARY + b"--\r\n"
+    )
+
+    responses = sharepoint_connector._parse_batch_response(content, BOUNDARY)
+
+    assert responses == [(200, b"a,b\r\n1,2\r\n"), (404, b'{"error": "missing"}')]
+
+
+def test_parse_batch_response_stops_at_closing_boundary():
+    """Anything after the closing boundary (the epilogue) is ignored."""
+    content = (
+        _batch_part(BOUNDARY, b"HTTP/1.1 200 OK", b"data")
+        + b"--" + BOUNDARY + b"--\r\n"
+        + _batch_part(BOUNDARY, b"HTTP/1.1 200 OK", b"epilogue")
+    )
+
+    responses = sharepoint_connector._parse_batch_response(content, BOUNDARY)
+
+    assert responses == [(200, b"data")]
+
+
+def test_parse_batch_response_empty_body_and_bad_status_line():
+    """A part without a body or without a parsable status line is still returned in place."""
+    content = (
+        _batch_part(BOUNDARY, b"HTTP/1.1 204 No Content")
+        + _batch_part(BOUNDARY, b"garbage")
+        + b"--" + BOUNDARY + b"--"
+    )
+
+    responses = sharepoint_connector._parse_batch_response(content, BOUNDARY)
+
+    assert responses == [(204, b""), (0, b"")]
+
+
+class FakeResponse:
+    def __init__(self, content=b"", headers=None, json_data=None):
+        self.content = content
+        self.headers = headers or {}
+        self._json_data = json_data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._json_data
+
+
+class FakeSession:
+    """requests.Session stand-in answering the form digest and $batch requests."""
+
+    def __init__(self, batch_content):
+        self.batch_content = batch_content
+        self.cookies = None
+
+    def post(self, url, data=None, headers=None):
+        if url.endswith("/_api/contextinfo"):
+            return FakeResponse(json_data={"d": {"GetContextWebInformation": {"FormDigestValue": "digest"}}})
+        return FakeResponse(
+            self.batch_content,
+            headers={"Content-Type": f'multipart/mixed; boundary="{BOUNDARY.decode()}"'},
+        )
+
+
+def _fetch(monkeypatch, batch_content):
+    requests = pytest.importorskip("requests")
+    monkeypatch.setattr(requests, "Session", lambda: FakeSession(batch_content))
+    connector = _connector(monkeypatch)
+    connector.authcookie = object()
+    files = [dict(file_info) for file_info in FILES]
+    connector._fetch_batched(files)
+    return connector, files
+
+
+def test_fetch_batched_leaves_failed_files_for_per_file_download(monkeypatch):
+    """Only successful sub-responses set Content; the others are left for the per-file fallback."""
+    content = (
+        _batch_part(BOUNDARY, b"HTTP/1.1 200 OK", b"a-content")
+        + _batch_part(BOUNDARY, b"HTTP/1.1 404 Not Found", b"")
+        + b"--" + BOUNDARY + b"--\r\n"
+    )
+
+    _, files = _fetch(monkeypatch, content)
+
+    assert files[0]["Content"] == b"a-content"
+    assert "Content" not in files[1]
+
+
+def test_fetch_batched_skips_batch_with_wrong_response_count(monkeypatch):
+    """A batch whose sub-responses cannot be matched to its files sets no Content at all."""
+    content = _batch_part(BOUNDARY, b"HTTP/1.1 200 OK", b"which-file") + b"--" + BOUNDARY + b"--\r\n"
+
+    connector, files = _fetch(monkeypatch, content)
+
+    assert all("Content" not in file_info for file_info in files)
+    assert "Expected 2 sub-responses, got 1" in connector.log_entries[-1]["Message"]
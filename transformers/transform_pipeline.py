@@ -1,9 +1,52 @@
 import pandas as pd
 import numpy as np
 import re
-from typing import Dict, List, Any, Optional, Union, Callable
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Union, Callable, Tuple
 import datetime
 
+_utcnow = datetime.datetime.utcnow
+
+_FILTER_OPS = ('<>', '>=', '<=', '=', '>', '<')
+_NULL_VALUES = ('null', 'blank()', '""', "''")
+
+@lru_cache(maxsize=1024)
+def _parse_filter(filter_condition: str) -> Tuple[str, Optional[str], Optional[str], Optional[str], Any]:
+    """
+    Parse a filter condition such as ``[amount] > 0`` once per distinct string.
+    
+    Args:
+        filter_condition: Raw filter condition from the provider settings
+        
+    Returns:
+        Tuple of (condition, column, operator, value kind, operand). The column is
+        None when the [column] part is missing and the operator is None when no
+        operator/value could be found. The value kind is 'null', 'numeric', 'text',
+        or 'error' with the conversion message as operand.
+    """
+    condition = filter_condition.strip()
+    col_match = re.search(r'\[(.*?)\]', condition)
+    if not col_match:
+        return condition, None, None, None, None
+    col_name = col_match.group(1).lower()
+    
+    for possible_op in _FILTER_OPS:
+        if possible_op in condition:
+            parts = condition.split(possible_op, 1)
+            if len(parts) == 2:
+                value = parts[1].strip()
+                if value.lower() in _NULL_VALUES:
+                    return condition, col_name, possible_op, 'null', None
+                if value.replace('.', '').replace('-', '').isdigit():
+                    try:
+                        return condition, col_name, possible_op, 'numeric', float(value)
+                    except ValueError as e:
+                        # Reported when the filter is applied, e.g. for dates like 2024-01-01
+                        return condition, col_name, possible_op, 'error', str(e)
+                return condition, col_name, possible_op, 'text', value.strip('"\'').lower()
+    
+    return condition, col_name, None, None, None
+
 class TransformPipeline:
     """Main pipeline for applying transformations to financial data."""
     
@@ -14,7 +57,7 @@ class TransformPipeline:
         """Create a standardized log entry."""
         log_entry = {
             "Step": step,
-            "Timestamp": datetime.datetime.utcnow().isoformat(),
+            "Timestamp": _utcnow().isoformat(),
             "Source": source,
             "ActionDetail": detail,
             "Message": message
@@ -39,22 +82,20 @@ class TransformPipeline:
             
         # Build renaming map
         rename_mappings = {}
-        source_columns = df.columns.tolist()
-        source_columns_upper = [col.upper() for col in source_columns]
+        # Map each upper-cased column name to the first column carrying it
+        source_columns = {}
+        for col in df.columns.tolist():
+            source_columns.setdefault(col.upper(), col)
         
         for syn in synonyms:
             logical_field = syn.get("LogicalField", "")
             alt_names = syn.get("AlternateNames", [])
             
             for alt_name in alt_names:
-                alt_name = alt_name.strip()
-                alt_name_upper = alt_name.upper()
-                
                 # Check if this alternate name exists in the DataFrame
-                for idx, col in enumerate(source_columns_upper):
-                    if alt_name_upper == col:
-                        rename_mappings[source_columns[idx]] = logical_field
-                        break
+                source_column = source_columns.get(alt_name.strip().upper())
+                if source_column is not None:
+                    rename_mappings[source_column] = logical_field
         
         # Apply renaming
         if rename_mappings:
@@ -95,20 +136,21 @@ class TransformPipeline:
         original_row_count = len(df)
         filter_logs = []
         
+        # All conditions are combined into one row mask and the frame is sliced once at the end
+        keep = np.ones(original_row_count, dtype=bool)
+        numeric_columns = {}
+        
         for filter_condition in filter_settings:
-            # Extract column name from [column] format
-            condition = filter_condition.strip()
-            col_match = re.search(r'\[(.*?)\]', condition)
+            # Conditions are parsed once per distinct string and reused across files
+            condition, col_name, op, kind, operand = _parse_filter(filter_condition)
             
-            if not col_match:
+            if col_name is None:
                 filter_logs.append({
                     "Filter": condition,
                     "Status": "Invalid filter format - missing [column]",
                     "RowsRemoved": 0
                 })
                 continue
-                
-            col_name = col_match.group(1).lower()
             
             if col_name not in df.columns:
                 filter_logs.append({
@@ -117,21 +159,8 @@ class TransformPipeline:
                     "RowsRemoved": 0
                 })
                 continue
-                
-            # Extract operator and value
-            ops = ['<>', '>=', '<=', '=', '>', '<']
-            op = None
-            value = None
-            
-            for possible_op in ops:
-                if possible_op in condition:
-                    parts = condition.split(possible_op, 1)
-                    if len(parts) == 2:
-                        op = possible_op
-                        value = parts[1].strip()
-                        break
             
-            if op is None or value is None:
+            if op is None:
                 filter_logs.append({
                     "Filter": condition,
                     "Status": "Invalid filter format - missing operator or value",
@@ -140,39 +169,49 @@ class TransformPipeline:
                 continue
                 
             # Apply filter
-            before_count = len(df)
+            before_count = int(keep.sum())
             
             try:
+                column = df[col_name]
+                mask = None
+                
+                if kind == 'error':
+                    raise ValueError(operand)
+                
                 # Handle null checks
-                if value.lower() in ('null', 'blank()', '""', "''"):
+                if kind == 'null':
                     if op == '=':
-                        df = df[df[col_name].isna() | (df[col_name] == '')]
+                        mask = column.isna() | (column == '')
                     elif op == '<>':
-                        df = df[df[col_name].notna() & (df[col_name] != '')]
+                        mask = column.notna() & (column != '')
                 # Handle numeric comparisons
-                elif value.replace('.', '').replace('-', '').isdigit():
-                    num_val = float(value)
+                elif kind == 'numeric':
+                    if col_name not in numeric_columns:
+                        numeric_columns[col_name] = pd.to_numeric(column, errors='coerce')
+                    numeric = numeric_columns[col_name]
                     if op == '=':
-                        df = df[pd.to_numeric(df[col_name], errors='coerce') == num_val]
+                        mask = numeric == operand
                     elif op == '<>':
-                        df = df[pd.to_numeric(df[col_name], errors='coerce') != num_val]
+                        mask = numeric != operand
                     elif op == '<':
-                        df = df[pd.to_numeric(df[col_name], errors='coerce') < num_val]
+                        mask = numeric < operand
                     elif op == '>':
-                        df = df[pd.to_numeric(df[col_name], errors='coerce') > num_val]
+                        mask = numeric > operand
                     elif op == '<=':
-                        df = df[pd.to_numeric(df[col_name], errors='coerce') <= num_val]
+                        mask = numeric <= operand
                     elif op == '>=':
-                        df = df[pd.to_numeric(df[col_name], errors='coerce') >= num_val]
+                        mask = numeric >= operand
                 # Handle text comparisons
                 else:
-                    text_val = value.strip('"\'')
                     if op == '=':
-                        df = df[df[col_name].astype(str).str.lower() == text_val.lower()]
+                        mask = column.astype(str).str.lower() == operand
                     elif op == '<>':
-                        df = df[df[col_name].astype(str).str.lower() != text_val.lower()]
+                        mask = column.astype(str).str.lower() != operand
                 
-                after_count = len(df)
+                if mask is not None:
+                    keep &= mask.to_numpy(dtype=bool)
+                
+                after_count = int(keep.sum())
                 rows_removed = before_count - after_count
                 
                 filter_logs.append({
@@ -188,6 +227,9 @@ class TransformPipeline:
                     "RowsRemoved": 0
                 })
         
+        if not keep.all():
+            df = df[keep]
+        
         # Add filter logs to main log
         for filter_log in filter_logs:
             self.create_log_entry(